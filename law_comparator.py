@@ -2,1217 +2,1812 @@
 # -*- coding: utf-8 -*-
 
 import json
-from typing import Dict, Tuple, Any, Set
-from difflib import SequenceMatcher, Differ
-import html
+from typing import Dict, List, Tuple, Any, Set
+from difflib import SequenceMatcher
 import os
-
-class LawComparator:
-    """法律条文对比器"""
-    
-    def __init__(self, similarity_threshold: float = 0.8):
-        """
-        初始化对比器
-        :param similarity_threshold: 相似度阈值，用于判断条文是否相同
-        """
-        self.similarity_threshold = similarity_threshold
-        self.manual_matches = []  # 存储手动匹配结果
-        
-    def calculate_similarity(self, text1: str, text2: str) -> float:
-        """计算两个文本的相似度"""
-        if not text1 or not text2:
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from dataclasses import dataclass, asdict
+
+# rapidfuzz 为可选依赖：安装后用其 C++ 实现批量计算相似度矩阵，
+# 未安装时自动回退到纯 Python 的 SequenceMatcher 逐对比较
+try:
+    import numpy  # rapidfuzz.process.cdist 的结果矩阵依赖 numpy
+    from rapidfuzz import fuzz as rf_fuzz
+    from rapidfuzz import process as rf_process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# scipy 同为可选依赖：有相似度矩阵时用匈牙利算法做全局最优指派，
+# 避免贪心匹配中先到的条文"抢走"更适合后面条文的候选
+try:
+    from scipy.optimize import linear_sum_assignment
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+# orjson 为可选依赖：Rust 实现的 JSON 序列化，对中文文本（原生 UTF-8）
+# 比标准库 json 快数倍
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# diff-match-patch 为可选依赖：Myers O(ND) 算法生成统一对比视图，
+# 比 difflib 快且配合语义清理后的分段更符合阅读习惯
+try:
+    from diff_match_patch import diff_match_patch
+    HAS_DMP = True
+except ImportError:
+    HAS_DMP = False
+
+# numba 为可选依赖：--fast 模式下用 JIT 编译的编辑距离比例
+# 替代 SequenceMatcher（数值口径与默认算法略有差异）
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _levenshtein_ratio(a, b):
+        """在 int32 码点数组上计算编辑距离相似度（滚动两行 DP）"""
+        la, lb = a.shape[0], b.shape[0]
+        if la == 0 or lb == 0:
             return 0.0
-        return SequenceMatcher(None, text1, text2).ratio()
-    
-    def find_best_match(self, target_article: Dict[str, Any], candidate_articles: Dict[int, Dict[str, Any]], 
-                       used_articles: Set[int]) -> Tuple[int, float]:
-        """
-        为目标条文在候选条文中找到最佳匹配
-        :param target_article: 目标条文
-        :param candidate_articles: 候选条文字典
-        :param used_articles: 已使用的条文编号集合
-        :return: (最佳匹配的条文编号, 相似度)
-        """
-        target_content = target_article.get('content', '')
-        best_match_num = -1
-        best_similarity = 0.0
-        
-        for article_num, article_info in candidate_articles.items():
-            if article_num in used_articles:
+        prev = np.arange(lb + 1)
+        curr = np.empty(lb + 1, dtype=np.int64)
+        for i in range(1, la + 1):
+            curr[0] = i
+            ai = a[i - 1]
+            for j in range(1, lb + 1):
+                cost = prev[j - 1] + (0 if ai == b[j - 1] else 1)
+                if prev[j] + 1 < cost:
+                    cost = prev[j] + 1
+                if curr[j - 1] + 1 < cost:
+                    cost = curr[j - 1] + 1
+                curr[j] = cost
+            prev, curr = curr, prev
+        return 1.0 - prev[lb] / max(la, lb)
+
+# 差异HTML位于元素文本位置，只需转义 & < >；
+# 预编译的 translate 表对长文本比 html.escape 的三次 replace 快约一倍
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# 超过该配对数时才启用进程池并行计算相似度矩阵（小任务进程开销不划算）
+PARALLEL_MIN_PAIRS = 10000
+
+# 字符集合 Jaccard 粗筛阈值：低于该值的候选不可能达到常用的相似度阈值，
+# 直接跳过完整的 ratio() 计算（取保守值以保证结果不变）
+JACCARD_BLOCK_THRESHOLD = 0.4
+
+def _unified_diff_html(old_text: str, new_text: str) -> str:
+    """
+    生成统一格式的HTML对比，在同一段落中显示删除（红色背景）和新增（绿色背景）
+    （模块级函数，便于进程池并行渲染）
+    """
+    # 优先使用 diff-match-patch（Myers 算法 + 语义清理），未安装时回退 difflib
+    if HAS_DMP:
+        dmp = diff_match_patch()
+        diffs = dmp.diff_main(old_text, new_text)
+        dmp.diff_cleanupSemantic(diffs)
+
+        html_parts = []
+        for op, data in diffs:
+            content = data.translate(_HTML_ESCAPE)
+            if not content:
                 continue
-                
-            candidate_content = article_info.get('content', '')
-            similarity = self.calculate_similarity(target_content, candidate_content)
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match_num = article_num
-        
-        return best_match_num, best_similarity
-    
-    def intelligent_article_matching(self, articles1: Dict[int, Dict[str, Any]], 
-                                   articles2: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        智能条文匹配算法（支持手动匹配优先）
-        优先使用手动匹配结果，然后基于内容相似度进行匹配
-        """
-        print("正在执行智能条文匹配...")
-        
-        # 匹配结果
-        matches = []  # [(article1_num, article2_num, similarity, match_type)]
-        used_articles1 = set()  # 已匹配的第一版本条文
-        used_articles2 = set()  # 已匹配的第二版本条文
-        
-        # 第0阶段：处理手动匹配结果
-        manual_matches_processed = 0
-        if self.manual_matches:
-            print(f"优先处理 {len(self.manual_matches)} 个手动匹配关系...")
-            
-            for match in self.manual_matches:
-                old_num = int(match['old_number'])
-                new_num = int(match['new_number'])
-                
-                # 检查条文是否存在
-                if old_num in articles1 and new_num in articles2:
-                    # 计算相似度
-                    similarity = self.calculate_similarity(
-                        articles1[old_num].get('content', ''),
-                        articles2[new_num].get('content', '')
-                    )
-                    
-                    matches.append((old_num, new_num, similarity, 'manual'))
-                    used_articles1.add(old_num)
-                    used_articles2.add(new_num)
-                    manual_matches_processed += 1
-                    print(f"  手动匹配：第{old_num}条 → 第{new_num}条 (相似度: {similarity:.3f})")
-                else:
-                    print(f"  警告：手动匹配中的条文不存在 - 第{old_num}条 或 第{new_num}条")
-            
-            print(f"手动匹配处理完成，成功处理 {manual_matches_processed} 个匹配关系")
-        
-        # 第一阶段：为剩余版本1中的每个条文找到版本2中的最佳匹配
-        remaining_articles1 = {k: v for k, v in articles1.items() if k not in used_articles1}
-        remaining_articles2 = {k: v for k, v in articles2.items() if k not in used_articles2}
-        
-        print(f"智能匹配剩余条文：{len(remaining_articles1)} 个原条文，{len(remaining_articles2)} 个新条文")
-        
-        for article1_num in sorted(remaining_articles1.keys()):
-            article1_info = remaining_articles1[article1_num]
-            
-            best_match_num, best_similarity = self.find_best_match(
-                article1_info, remaining_articles2, used_articles2
-            )
-            
-            if best_match_num != -1 and best_similarity >= self.similarity_threshold:
-                matches.append((article1_num, best_match_num, best_similarity, 'auto'))
-                used_articles2.add(best_match_num)
-                print(f"  智能匹配：第{article1_num}条 → 第{best_match_num}条 (相似度: {best_similarity:.3f})")
-            else:
-                matches.append((article1_num, -1, 0.0, 'none'))  # 没有找到匹配，标记为删除
-        
-        # 第二阶段：处理版本2中未匹配的条文（新增条文）
-        new_articles = []
-        for article2_num in sorted(articles2.keys()):
-            if article2_num not in used_articles2:
-                new_articles.append(article2_num)
-                print(f"  新增：第{article2_num}条")
-        
-        print(f"匹配统计：{manual_matches_processed} 个手动匹配，{len([m for m in matches if m[3] == 'auto'])} 个智能匹配")
-        
-        return {
-            'matches': matches,
-            'new': new_articles,
-            'used_articles2': used_articles2,
-            'manual_matches_count': manual_matches_processed
+            if op == 0:  # 相同的部分
+                html_parts.append(content)
+            elif op == -1:  # 删除的部分
+                html_parts.append(f'<span class="diff-deleted">{content}</span>')
+            else:  # 新增的部分
+                html_parts.append(f'<span class="diff-added">{content}</span>')
+        return ''.join(html_parts)
+
+    matcher = SequenceMatcher(None, old_text, new_text, autojunk=False)
+
+    html_parts = []
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':  # 相同的部分
+            content = old_text[i1:i2].translate(_HTML_ESCAPE)
+            if content:
+                html_parts.append(content)
+            continue
+        if tag in ('replace', 'delete'):  # 删除的部分
+            content = old_text[i1:i2].translate(_HTML_ESCAPE)
+            if content:
+                html_parts.append(f'<span class="diff-deleted">{content}</span>')
+        if tag in ('replace', 'insert'):  # 新增的部分
+            content = new_text[j1:j2].translate(_HTML_ESCAPE)
+            if content:
+                html_parts.append(f'<span class="diff-added">{content}</span>')
+
+    return ''.join(html_parts)
+
+# 对比结果的条文记录：slots 数据类比同字段的 dict 省约四成内存，
+# 属性访问也更快；序列化时再经 asdict 转回普通字典
+@dataclass(slots=True)
+class IdenticalRecord:
+    """几乎完全相同的条文"""
+    old_number: int
+    new_number: int
+    content: str
+    similarity: float
+    match_type: str
+
+@dataclass(slots=True)
+class ModifiedRecord:
+    """发生修改的条文"""
+    old_number: int
+    new_number: int
+    old_content: str
+    new_content: str
+    similarity: float
+    match_type: str
+    old_chapter_info: Dict[str, Any]
+    new_chapter_info: Dict[str, Any]
+    unified_diff_html: str = ''
+    # 相似度徽章展示值，Python 侧算好免得前端每次渲染都重算
+    similarity_pct: int = 0
+    similarity_class: str = ''
+
+@dataclass(slots=True)
+class NewRecord:
+    """新增的条文"""
+    article_number: int
+    content: str
+    chapter_info: Dict[str, Any]
+
+@dataclass(slots=True)
+class DeletedRecord:
+    """删除的条文"""
+    article_number: int
+    content: str
+    chapter_info: Dict[str, Any]
+
+def _score_row(target_content: str, cand_contents: List[str]) -> List[float]:
+    """子进程任务：计算一个目标条文对全部候选内容的相似度行"""
+    matcher = SequenceMatcher(None, autojunk=False)
+    matcher.set_seq2(target_content)
+    row = []
+    for candidate_content in cand_contents:
+        if not target_content or not candidate_content:
+            row.append(0.0)
+        elif candidate_content == target_content:
+            row.append(1.0)
+        else:
+            matcher.set_seq1(candidate_content)
+            row.append(matcher.ratio())
+    return row
+
+# HTML报告模板：模块加载时就按数据占位符切成头尾两段，
+# 生成报告时直接写两段，免去每次调用扫描整段模板找占位符
+_HTML_TEMPLATE = '''<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>法律条文对比结果</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
         }
-    
-    def compare_articles(self, law1: Dict[str, Any], law2: Dict[str, Any]) -> Dict[str, Any]:
-        """比较两个法律版本的条文"""
-        print("正在比较法律条文...")
-        
-        articles1 = law1.get('articles', {})
-        articles2 = law2.get('articles', {})
-        
-        # 执行智能匹配
-        matching_result = self.intelligent_article_matching(articles1, articles2)
-        
-        comparison_result = {
-            'identical': [],      # 完全相同的条文
-            'modified': [],       # 修改的条文
-            'new': [],   # 新增的条文
-            'deleted': [], # 删除的条文
-            'mapping': {}         # 条文编号映射关系
+
+        body {
+            font-family: 'Microsoft YaHei', 'PingFang SC', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            padding: 20px;
         }
-        
-        # 统计信息
-        stats = {
-            'total_articles_v1': len(articles1),
-            'total_articles_v2': len(articles2),
-            'identical_count': 0,
-            'modified_count': 0,
-            'new_count': 0,
-            'deleted_count': 0
+
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 15px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            overflow: hidden;
         }
-        
-        # 处理匹配结果
-        manual_count = 0
-        auto_count = 0
-        
-        for match_data in matching_result['matches']:
-            # 兼容不同的匹配结果格式
-            if len(match_data) == 4:
-                article1_num, article2_num, similarity, match_type = match_data
-            else:
-                article1_num, article2_num, similarity = match_data
-                match_type = 'auto'
-            
-            if match_type == 'manual':
-                manual_count += 1
-            elif match_type == 'auto':
-                auto_count += 1
-            
-            if article2_num == -1:
-                # 删除的条文
-                article1_info = articles1[article1_num]
-                # 收集章节信息
-                chapter_info = {
-                    'chapter_num': article1_info.get('chapter_num'),
-                    'chapter_title': law1.get('chapters', {}).get(article1_info.get('chapter_num'), {}).get('title', ''),
-                    'section_num': article1_info.get('section_num'),
-                    'section_title': law1.get('sections', {}).get(article1_info.get('section_num'), {}).get('title', '')
-                }
-                comparison_result['deleted'].append({
-                    'article_number': article1_num,
-                    'content': article1_info.get('content', ''),
-                    'chapter_info': chapter_info
-                })
-                stats['deleted_count'] += 1
-            else:
-                # 建立映射关系
-                comparison_result['mapping'][article1_num] = article2_num
-                
-                content1 = articles1[article1_num].get('content', '')
-                content2 = articles2[article2_num].get('content', '')
-                
-                if similarity >= 0.98:  # 几乎完全相同
-                    comparison_result['identical'].append({
-                        'old_number': article1_num,
-                        'new_number': article2_num,
-                        'content': content1,
-                        'similarity': similarity,
-                        'match_type': match_type
-                    })
-                    stats['identical_count'] += 1
-                else:
-                    # 收集章节信息
-                    old_chapter_info = {
-                        'chapter_num': articles1[article1_num].get('chapter_num'),
-                        'chapter_title': law1.get('chapters', {}).get(articles1[article1_num].get('chapter_num'), {}).get('title', ''),
-                        'section_num': articles1[article1_num].get('section_num'),
-                        'section_title': law1.get('sections', {}).get(articles1[article1_num].get('section_num'), {}).get('title', '')
-                    }
-                    new_chapter_info = {
-                        'chapter_num': articles2[article2_num].get('chapter_num'),
-                        'chapter_title': law2.get('chapters', {}).get(articles2[article2_num].get('chapter_num'), {}).get('title', ''),
-                        'section_num': articles2[article2_num].get('section_num'),
-                        'section_title': law2.get('sections', {}).get(articles2[article2_num].get('section_num'), {}).get('title', '')
-                    }
-                    
-                    # 生成高亮对比HTML
-                    unified_diff_html = self.generate_unified_html_diff(content1, content2)
-                    
-                    # 修改的条文
-                    comparison_result['modified'].append({
-                        'old_number': article1_num,
-                        'new_number': article2_num,
-                        'old_content': content1,
-                        'new_content': content2,
-                        'similarity': similarity,
-                        'match_type': match_type,
-                        'old_chapter_info': old_chapter_info,
-                        'new_chapter_info': new_chapter_info,
-                        'unified_diff_html': unified_diff_html
-                    })
-                    stats['modified_count'] += 1
-        
-        # 处理新增条文
-        for article2_num in matching_result['new']:
-            article2_info = articles2[article2_num]
-            # 收集章节信息
-            chapter_info = {
-                'chapter_num': article2_info.get('chapter_num'),
-                'chapter_title': law2.get('chapters', {}).get(article2_info.get('chapter_num'), {}).get('title', ''),
-                'section_num': article2_info.get('section_num'),
-                'section_title': law2.get('sections', {}).get(article2_info.get('section_num'), {}).get('title', '')
+
+        .header {
+            background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+
+        .header h1 {
+            font-size: 2.5rem;
+            margin-bottom: 10px;
+            font-weight: 300;
+        }
+
+        .header p {
+            opacity: 0.8;
+            font-size: 1.1rem;
+        }
+
+        .metadata {
+            background: #f8f9fa;
+            padding: 20px;
+            border-bottom: 1px solid #e9ecef;
+        }
+
+        .metadata-item {
+            display: inline-block;
+            margin-right: 30px;
+            margin-bottom: 10px;
+        }
+
+        .metadata-label {
+            font-weight: 600;
+            color: #495057;
+        }
+
+        .stats {
+            display: flex;
+            justify-content: space-around;
+            padding: 20px;
+            background: #f1f3f4;
+            border-bottom: 1px solid #e9ecef;
+        }
+
+        .stat-item {
+            text-align: center;
+            padding: 15px;
+            border-radius: 10px;
+            background: white;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            min-width: 120px;
+        }
+
+        .stat-number {
+            font-size: 2rem;
+            font-weight: bold;
+            margin-bottom: 5px;
+        }
+
+        .stat-label {
+            color: #6c757d;
+            font-size: 0.9rem;
+        }
+
+        .identical .stat-number { color: #17a2b8; }
+        .modified .stat-number { color: #ffc107; }
+        .deleted .stat-number { color: #dc3545; }
+        .new .stat-number { color: #28a745; }
+
+        .filters {
+            padding: 20px;
+            background: white;
+            border-bottom: 1px solid #e9ecef;
+            display: flex;
+            gap: 15px;
+            align-items: center;
+        }
+
+        .filter-button {
+            padding: 8px 16px;
+            border: 2px solid #dee2e6;
+            background: white;
+            border-radius: 25px;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            font-size: 0.9rem;
+        }
+
+        .filter-button.active {
+            background: #007bff;
+            color: white;
+            border-color: #007bff;
+        }
+
+        .filter-button:hover {
+            border-color: #007bff;
+            transform: translateY(-2px);
+        }
+
+        .content {
+            padding: 20px;
+            max-height: 70vh;
+            overflow-y: auto;
+        }
+
+        .section {
+            margin-bottom: 30px;
+        }
+
+        .section.filter-hidden {
+            display: none;
+        }
+
+        .section-title {
+            font-size: 1.5rem;
+            font-weight: 600;
+            margin-bottom: 20px;
+            padding: 15px;
+            border-radius: 10px;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+        }
+
+        .section-title:hover {
+            transform: translateX(5px);
+        }
+
+        .section-title .toggle-icon {
+            font-size: 1.2rem;
+            transition: transform 0.3s ease;
+        }
+
+        .section-title.collapsed .toggle-icon {
+            transform: rotate(-90deg);
+        }
+
+        .section-identical .section-title {
+            background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
+            color: #0277bd;
+        }
+
+        .section-modified .section-title {
+            background: linear-gradient(135deg, #fff8e1 0%, #ffecb3 100%);
+            color: #f57c00;
+        }
+
+        .section-deleted .section-title {
+            background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%);
+            color: #c62828;
+        }
+
+        .section-new .section-title {
+            background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%);
+            color: #2e7d32;
+        }
+
+        .articles-list {
+            display: block;
+            transition: all 0.5s ease;
+        }
+
+        .articles-list.collapsed {
+            display: none;
+        }
+
+        .article-item {
+            background: white;
+            border: 1px solid #e9ecef;
+            border-radius: 10px;
+            margin-bottom: 15px;
+            overflow: hidden;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
+            transition: all 0.3s ease;
+        }
+
+        .article-item:hover {
+            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
+            transform: translateY(-2px);
+        }
+
+        /* 文本对比高亮样式 */
+        .diff-deleted {
+            background-color: #ffdddd;
+            color: #721c24;
+            padding: 2px 4px;
+            border-radius: 3px;
+            text-decoration: line-through;
+            border: 1px solid #f5c6cb;
+            margin: 0 1px;
+        }
+
+        .diff-added {
+            background-color: #d4edda;
+            color: #155724;
+            padding: 2px 4px;
+            border-radius: 3px;
+            border: 1px solid #c3e6cb;
+            margin: 0 1px;
+        }
+
+        /* 增强对比容器样式 */
+        .diff-container {
+            display: flex;
+            gap: 20px;
+            margin: 15px 0;
+        }
+
+        .diff-panel {
+            flex: 1;
+            border: 1px solid #dee2e6;
+            border-radius: 8px;
+            overflow: hidden;
+        }
+
+        .diff-header {
+            background: #f8f9fa;
+            padding: 10px 15px;
+            font-weight: 600;
+            border-bottom: 1px solid #dee2e6;
+            font-size: 0.9rem;
+            color: #495057;
+        }
+
+        .diff-content {
+            padding: 15px;
+            white-space: pre-wrap;
+            line-height: 1.8;
+            font-size: 0.95rem;
+        }
+
+
+        /* 统一对比显示样式 */
+        .unified-diff {
+            background: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 8px;
+            padding: 20px;
+            margin: 15px 0;
+            line-height: 1.8;
+            font-size: 0.95rem;
+        }
+
+        .unified-diff-header {
+            font-weight: 600;
+            color: #495057;
+            margin-bottom: 10px;
+            padding-bottom: 10px;
+            border-bottom: 1px solid #dee2e6;
+        }
+
+        /* 响应式设计 */
+        @media (max-width: 768px) {
+            .diff-container {
+                flex-direction: column;
             }
-            comparison_result['new'].append({
-                'article_number': article2_num,
-                'content': article2_info.get('content', ''),
-                'chapter_info': chapter_info
-            })
-            stats['new_count'] += 1
-        
-        # 排序结果
-        comparison_result['identical'].sort(key=lambda x: x['old_number'])
-        comparison_result['modified'].sort(key=lambda x: x['old_number'])
-        comparison_result['new'].sort(key=lambda x: x['article_number'])
-        comparison_result['deleted'].sort(key=lambda x: x['article_number'])
-        
-        # 添加匹配方式统计
-        stats['manual_matches_count'] = manual_count
-        stats['auto_matches_count'] = auto_count
-        
-        comparison_result['statistics'] = stats
-        
-        print(f"智能对比完成：")
-        print(f"  相同条文: {stats['identical_count']} 条")
-        print(f"  修改条文: {stats['modified_count']} 条")
-        print(f"  新增条文: {stats['new_count']} 条")
-        print(f"  删除条文: {stats['deleted_count']} 条")
-        print(f"  匹配方式: {manual_count} 个手动匹配, {auto_count} 个智能匹配")
-        
-        return comparison_result
-    
-    def generate_unified_html_diff(self, old_text: str, new_text: str) -> str:
-        """
-        生成统一格式的HTML对比，在同一段落中显示删除（红色背景）和新增（绿色背景）
-        """
-        differ = Differ()
-        diff_result = list(differ.compare(old_text, new_text))
-        
-        html_parts = []
-        
-        for line in diff_result:
-            if line.startswith('  '):  # 相同的部分
-                content = html.escape(line[2:].strip())
-                if content:
-                    html_parts.append(content)
-            elif line.startswith('- '):  # 删除的部分
-                content = html.escape(line[2:].strip())
-                if content:
-                    html_parts.append(f'<span class="diff-deleted">{content}</span>')
-            elif line.startswith('+ '):  # 新增的部分
-                content = html.escape(line[2:].strip())
-                if content:
-                    html_parts.append(f'<span class="diff-added">{content}</span>')
-        
-        return ''.join(html_parts)
-    
-    def _format_chapter_info(self, old_chapter_info: Dict[str, Any] = None, new_chapter_info: Dict[str, Any] = None) -> str:
-        """格式化章节信息"""
-        def format_single_chapter(info):
-            if not info:
-                return "未知"
-            
-            chapter_part = f"第{info.get('chapter_num', '?')}章"
-            if info.get('chapter_title'):
-                chapter_part += f"《{info['chapter_title']}》"
-            
-            if info.get('section_num'):
-                section_part = f"第{info['section_num']}节"
-                if info.get('section_title'):
-                    section_part += f"《{info['section_title']}》"
-                return f"{chapter_part} - {section_part}"
             
-            return chapter_part
-        
-        if old_chapter_info and new_chapter_info:
-            old_formatted = format_single_chapter(old_chapter_info)
-            new_formatted = format_single_chapter(new_chapter_info)
-            if old_formatted == new_formatted:
-                return old_formatted
-            else:
-                return f"{old_formatted} → {new_formatted}"
-        elif old_chapter_info:
-            return format_single_chapter(old_chapter_info)
-        elif new_chapter_info:
-            return format_single_chapter(new_chapter_info)
-        else:
-            return ""
-    
-    def save_comparison_data(self, comparison_data: Dict[str, Any], 
-                           law1_info: Dict[str, Any], law2_info: Dict[str, Any],
-                           output_file: str = "法律条文对比数据.json"):
-        """保存对比数据到JSON文件"""
-        full_comparison = {
-            'metadata': {
-                'law1_file': os.path.basename(law1_info.get('file_path', '未知')),
-                'law2_file': os.path.basename(law2_info.get('file_path', '未知')),
-            },
-            'comparison_result': comparison_data,
-            'law1_metadata': law1_info.get('metadata', {}),
-            'law2_metadata': law2_info.get('metadata', {})
+            .diff-panel {
+                margin-bottom: 15px;
+            }
         }
-        
-        try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(full_comparison, f, ensure_ascii=False, indent=2)
-            print(f"对比数据已保存到: {output_file}")
-        except Exception as e:
-            print(f"保存对比数据时出错: {e}")
-    
-    def load_manual_matches(self, manual_matches_file: str) -> bool:
-        """
-        加载手动匹配结果
-        :param manual_matches_file: 手动匹配结果JSON文件路径
-        :return: 是否加载成功
-        """
-        try:
-            with open(manual_matches_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.manual_matches = data.get('manual_matches', [])
-                print(f"已加载 {len(self.manual_matches)} 个手动匹配关系")
-                return True
-        except FileNotFoundError:
-            print(f"手动匹配文件未找到: {manual_matches_file}")
-            return False
-        except Exception as e:
-            print(f"加载手动匹配文件时出错: {e}")
-            return False
-    
-    def is_manually_matched(self, old_number: int = None, new_number: int = None) -> bool:
-        """
-        检查指定条文是否已被手动匹配
-        :param old_number: 原版本条文编号
-        :param new_number: 新版本条文编号
-        :return: 是否已被手动匹配
-        """
-        for match in self.manual_matches:
-            if old_number is not None and str(match['old_number']) == str(old_number):
-                return True
-            if new_number is not None and str(match['new_number']) == str(new_number):
-                return True
-        return False
 
-    def generate_html_report(self, comparison_data: Dict[str, Any], 
-                           law1_info: Dict[str, Any], law2_info: Dict[str, Any],
-                           output_file: str = "法律条文对比结果.html"):
-        """生成HTML格式的对比报告"""
-        
-        # 构建完整的比较数据
-        full_comparison = {
-            'metadata': {
-                'law1_file': os.path.basename(law1_info.get('file_path', '未知')),
-                'law2_file': os.path.basename(law2_info.get('file_path', '未知')),
-            },
-            'comparison_result': comparison_data
+        .article-header {
+            padding: 15px 20px;
+            background: #f8f9fa;
+            border-bottom: 1px solid #e9ecef;
+            cursor: pointer;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
         }
-        
-        # HTML模板
-        html_template = '''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>法律条文对比结果</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
+
+        .article-number {
+            font-weight: 600;
+            font-size: 1.1rem;
         }
 
-        body {
-            font-family: 'Microsoft YaHei', 'PingFang SC', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
+        .article-meta {
+            display: flex;
+            gap: 15px;
+            align-items: center;
         }
 
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
+        .similarity-badge {
+            background: #28a745;
+            color: white;
+            padding: 4px 8px;
             border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            font-size: 0.8rem;
+        }
+
+        .similarity-badge.medium {
+            background: #ffc107;
+            color: #212529;
+        }
+
+        .similarity-badge.low {
+            background: #dc3545;
+        }
+
+        .chapter-info {
+            font-size: 0.9rem;
+            color: #6c757d;
+        }
+
+        .expand-icon {
+            transition: transform 0.3s ease;
+        }
+
+        .article-header.expanded .expand-icon {
+            transform: rotate(180deg);
+        }
+
+        .article-content {
+            display: none;
+            padding: 20px;
+        }
+
+        .article-content.expanded {
+            display: block;
+        }
+
+        .diff-container {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 20px;
+            margin-bottom: 20px;
+        }
+
+        .diff-panel {
+            border: 1px solid #e9ecef;
+            border-radius: 8px;
             overflow: hidden;
         }
 
-        .header {
-            background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
+        .diff-header {
+            padding: 10px 15px;
+            font-weight: 600;
             color: white;
-            padding: 30px;
-            text-align: center;
         }
 
-        .header h1 {
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            font-weight: 300;
+        .diff-old .diff-header {
+            background: #dc3545;
+        }
+
+        .diff-new .diff-header {
+            background: #28a745;
+        }
+
+        .diff-content {
+            padding: 15px;
+            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+            line-height: 1.8;
+            white-space: pre-wrap;
+            max-height: 300px;
+            overflow-y: auto;
+        }
+
+        .diff-old .diff-content {
+            background: #fff5f5;
+        }
+
+        .diff-new .diff-content {
+            background: #f0fff4;
+        }
+
+        .highlight-removed {
+            background: #ffdddd;
+            text-decoration: line-through;
+            padding: 2px 4px;
+            border-radius: 3px;
         }
 
-        .header p {
-            opacity: 0.8;
-            font-size: 1.1rem;
+        .highlight-added {
+            background: #ddffdd;
+            padding: 2px 4px;
+            border-radius: 3px;
         }
 
-        .metadata {
+        .changes-list {
+            margin-top: 15px;
+            padding: 15px;
             background: #f8f9fa;
-            padding: 20px;
-            border-bottom: 1px solid #e9ecef;
-        }
-
-        .metadata-item {
-            display: inline-block;
-            margin-right: 30px;
-            margin-bottom: 10px;
+            border-radius: 8px;
         }
 
-        .metadata-label {
+        .changes-title {
             font-weight: 600;
+            margin-bottom: 10px;
             color: #495057;
         }
 
-        .stats {
-            display: flex;
-            justify-content: space-around;
-            padding: 20px;
-            background: #f1f3f4;
-            border-bottom: 1px solid #e9ecef;
+        .change-item {
+            padding: 5px 0;
+            color: #6c757d;
+            font-size: 0.9rem;
         }
 
-        .stat-item {
-            text-align: center;
+        .identical-content {
             padding: 15px;
-            border-radius: 10px;
-            background: white;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            min-width: 120px;
+            background: #f8f9fa;
+            border-radius: 8px;
+            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+            line-height: 1.8;
         }
 
-        .stat-number {
-            font-size: 2rem;
-            font-weight: bold;
-            margin-bottom: 5px;
+        .empty-section {
+            text-align: center;
+            padding: 30px;
+            color: #6c757d;
+            font-style: italic;
         }
 
-        .stat-label {
-            color: #6c757d;
-            font-size: 0.9rem;
+        @media (max-width: 768px) {
+            .diff-container {
+                grid-template-columns: 1fr;
+            }
+            
+            .stats {
+                flex-direction: column;
+                gap: 15px;
+            }
+            
+            .filters {
+                flex-wrap: wrap;
+            }
         }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 法律条文对比结果</h1>
+            <p>智能对比分析，支持差异展示与详细查看</p>
+        </div>
 
-        .identical .stat-number { color: #17a2b8; }
-        .modified .stat-number { color: #ffc107; }
-        .deleted .stat-number { color: #dc3545; }
-        .new .stat-number { color: #28a745; }
+        <div class="metadata" id="metadata">
+            <!-- 元数据将在这里动态生成 -->
+        </div>
 
-        .filters {
-            padding: 20px;
-            background: white;
-            border-bottom: 1px solid #e9ecef;
-            display: flex;
-            gap: 15px;
-            align-items: center;
-        }
+        <div class="stats" id="stats">
+            <div class="stat-item identical">
+                <div class="stat-number" id="identicalCount">0</div>
+                <div class="stat-label">相同条文</div>
+            </div>
+            <div class="stat-item modified">
+                <div class="stat-number" id="modifiedCount">0</div>
+                <div class="stat-label">修改条文</div>
+            </div>
+            <div class="stat-item deleted">
+                <div class="stat-number" id="deletedCount">0</div>
+                <div class="stat-label">删除条文</div>
+            </div>
+            <div class="stat-item new">
+                <div class="stat-number" id="newCount">0</div>
+                <div class="stat-label">新增条文</div>
+            </div>
+        </div>
 
-        .filter-button {
-            padding: 8px 16px;
-            border: 2px solid #dee2e6;
-            background: white;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 0.9rem;
-        }
+        <div class="filters" id="filters">
+            <span>显示类型：</span>
+            <button class="filter-button active" data-filter="all">全部</button>
+            <button class="filter-button" data-filter="modified">修改条文</button>
+            <button class="filter-button" data-filter="identical">相同条文</button>
+            <button class="filter-button" data-filter="deleted">删除条文</button>
+            <button class="filter-button" data-filter="new">新增条文</button>
+        </div>
 
-        .filter-button.active {
-            background: #007bff;
-            color: white;
-            border-color: #007bff;
-        }
+        <div class="content" id="content">
+            <!-- 内容将在这里动态生成 -->
+        </div>
+    </div>
 
-        .filter-button:hover {
-            border-color: #007bff;
-            transform: translateY(-2px);
-        }
+    <script type="application/json" id="cmp-data">EMBEDDED_DATA_PLACEHOLDER</script>
+    <script>
+        // 调试日志默认关闭；需要时先在控制台执行 window.DEBUG_LAW_COMPARE = true 再刷新
+        window.DEBUG_LAW_COMPARE = window.DEBUG_LAW_COMPARE || false;
 
-        .content {
-            padding: 20px;
-            max-height: 70vh;
-            overflow-y: auto;
-        }
+        class ComparisonViewer {
+            constructor() {
+                // 数据放在 application/json 块里用 JSON.parse 读取：
+                // 对大数据比 JS 字面量解析快，正文里的特殊序列也无法破坏脚本
+                this.data = JSON.parse(document.getElementById('cmp-data').textContent);
+                this.currentFilter = 'all';
+                this.collapsedSections = new Set();
+                this.chunkObservers = [];  // 分块懒挂载用的 IntersectionObserver
+                // 条文对象 -> 已构建的 DOM 节点；条文数据在页面生命周期内不变，
+                // 切换筛选重新挂载时直接复用，WeakMap 不阻碍回收
+                this.articleNodeCache = new WeakMap();
+                this.lastStats = { identical: -1, modified: -1, deleted: -1, new: -1 };
+                this.sectionRefs = new Map();  // sectionId -> { titleEl, listEl }
+                this.articleData = new Map();  // articleId -> { article, type }，正文懒构建用
+                
+                // 数据验证
+                if (!this.data || !this.data.comparison_result) {
+                    console.error('数据格式错误:', this.data);
+                    return;
+                }
+                
+                this.init();
+            }
 
-        .section {
-            margin-bottom: 30px;
-        }
+            init() {
+                try {
+                    if (window.DEBUG_LAW_COMPARE) console.log('初始化比较查看器...', this.data);
+                    // 常用节点只查一次，后续渲染直接用缓存引用
+                    this.contentEl = document.getElementById('content');
+                    this.metadataEl = document.getElementById('metadata');
+                    this.statCountEls = {
+                        identical: document.getElementById('identicalCount'),
+                        modified: document.getElementById('modifiedCount'),
+                        deleted: document.getElementById('deletedCount'),
+                        new: document.getElementById('newCount')
+                    };
+                    this.filterBar = document.getElementById('filters');
+                    this.activeFilterBtn = this.filterBar.querySelector('.filter-button.active');
+                    this.setupEventListeners();
+                    this.renderMetadata();
+                    this.renderStats();
+                    this.renderContent();
+                    if (window.DEBUG_LAW_COMPARE) console.log('比较查看器初始化完成');
+                } catch (error) {
+                    console.error('初始化失败:', error);
+                }
+            }
 
-        .section-title {
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin-bottom: 20px;
-            padding: 15px;
-            border-radius: 10px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }
+            setupEventListeners() {
+                // 筛选栏同样只挂一个委托监听器
+                this.filterBar.addEventListener('click', (e) => {
+                    const button = e.target.closest('.filter-button');
+                    if (button) {
+                        this.setFilter(button.dataset.filter, button);
+                    }
+                });
 
-        .section-title:hover {
-            transform: translateX(5px);
-        }
+                // 内容区只挂一个委托监听器，按 data- 属性分发，
+                // 免去给每个条文/分组标题单独绑定处理函数
+                this.contentEl.addEventListener('click', (e) => {
+                    const articleEl = e.target.closest('[data-article-id]');
+                    if (articleEl) {
+                        this.toggleArticle(articleEl.dataset.articleId);
+                        return;
+                    }
+                    const sectionEl = e.target.closest('[data-section-id]');
+                    if (sectionEl) {
+                        this.toggleSection(sectionEl.dataset.sectionId);
+                    }
+                });
+            }
 
-        .section-title .toggle-icon {
-            font-size: 1.2rem;
-            transition: transform 0.3s ease;
-        }
+            setFilter(filter, button) {
+                this.currentFilter = filter;
 
-        .section-title.collapsed .toggle-icon {
-            transform: rotate(-90deg);
-        }
+                // 只动上一个和新的激活按钮，不遍历整个按钮组
+                if (button !== this.activeFilterBtn) {
+                    if (this.activeFilterBtn) {
+                        this.activeFilterBtn.classList.remove('active');
+                    }
+                    button.classList.add('active');
+                    this.activeFilterBtn = button;
+                }
 
-        .section-identical .section-title {
-            background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
-            color: #0277bd;
-        }
+                this.applyFilter();
+            }
+
+            renderMetadata() {
+                const metadata = this.data.metadata;
+                const metadataEl = this.metadataEl;
+                
+                metadataEl.innerHTML = `
+                    <div class="metadata-item">
+                        <span class="metadata-label">原版文件：</span>
+                        ${metadata.law1_file}
+                    </div>
+                    <div class="metadata-item">
+                        <span class="metadata-label">新版文件：</span>
+                        ${metadata.law2_file}
+                    </div>
+                `;
+            }
+
+            renderStats() {
+                const result = this.data.comparison_result;
+                const counts = {
+                    identical: (result.identical || []).length,
+                    modified: (result.modified || []).length,
+                    deleted: (result.deleted || []).length,
+                    new: (result.new || []).length
+                };
+
+                // 四个计数合并到同一帧写入，数值没变的跳过，
+                // 避免重复触发样式失效
+                requestAnimationFrame(() => {
+                    for (const key of Object.keys(counts)) {
+                        if (this.lastStats[key] !== counts[key]) {
+                            this.statCountEls[key].textContent = counts[key];
+                            this.lastStats[key] = counts[key];
+                        }
+                    }
+                });
+            }
+
+            renderContent() {
+                const contentEl = this.contentEl;
+                const result = this.data.comparison_result;
+
+                // 重建前断开旧的懒挂载观察器，避免残留回调引用已卸载的节点
+                this.chunkObservers.forEach(observer => observer.disconnect());
+                this.chunkObservers = [];
+
+                // 用 DocumentFragment 一次性构建再整体插入；
+                // textContent 赋值自带转义，不再拼接 HTML 字符串
+                const fragment = document.createDocumentFragment();
+                const sections = [
+                    ['modified', '修改的条文', result.modified || []],
+                    ['identical', '相同的条文', result.identical || []],
+                    ['deleted', '删除的条文', result.deleted || []],
+                    ['new', '新增的条文', result.new || []]
+                ];
+
+                // 四个分组容器只构建一次，筛选时用 CSS 隐藏而不是重建
+                this.sectionEls = new Map();
+                for (const [sectionId, title, articles] of sections) {
+                    const sectionEl = this.renderSection(sectionId, title, articles, sectionId);
+                    this.sectionEls.set(sectionId, sectionEl);
+                    fragment.appendChild(sectionEl);
+                }
+
+                contentEl.textContent = '';
+                contentEl.appendChild(fragment);
+                this.applyFilter();
+            }
+
+            applyFilter() {
+                for (const [sectionId, sectionEl] of this.sectionEls) {
+                    const hidden = this.currentFilter !== 'all' && this.currentFilter !== sectionId;
+                    sectionEl.classList.toggle('filter-hidden', hidden);
+                }
+            }
+
+            renderSection(sectionId, title, articles, type) {
+                const isCollapsed = this.collapsedSections.has(sectionId);
+
+                const section = document.createElement('div');
+                section.className = `section section-${type}`;
+                section.id = `section-${sectionId}`;
+
+                const titleEl = document.createElement('div');
+                titleEl.className = isCollapsed ? 'section-title collapsed' : 'section-title';
+                titleEl.dataset.sectionId = sectionId;
+
+                const titleText = document.createElement('span');
+                titleText.textContent = `${title} (${articles.length})`;
+                const toggleIcon = document.createElement('span');
+                toggleIcon.className = 'toggle-icon';
+                toggleIcon.textContent = '▼';
+                titleEl.appendChild(titleText);
+                titleEl.appendChild(toggleIcon);
+                section.appendChild(titleEl);
+
+                const listEl = document.createElement('div');
+                listEl.className = isCollapsed ? 'articles-list collapsed' : 'articles-list';
+
+                if (!articles || articles.length === 0) {
+                    const empty = document.createElement('div');
+                    empty.className = 'empty-section';
+                    empty.textContent = `暂无${title.replace('的条文', '')}条文`;
+                    listEl.appendChild(empty);
+                } else {
+                    this.mountArticleChunks(listEl, articles, type, sectionId);
+                }
+
+                section.appendChild(listEl);
+                this.sectionRefs.set(sectionId, { titleEl, listEl });
+                return section;
+            }
 
-        .section-modified .section-title {
-            background: linear-gradient(135deg, #fff8e1 0%, #ffecb3 100%);
-            color: #f57c00;
-        }
+            mountArticleChunks(listEl, articles, type, sectionId) {
+                // 先只挂载首屏一块，滚动接近末尾哨兵时再挂载下一块，
+                // 让 DOM 规模跟随可见范围而不是条文总数
+                const CHUNK_SIZE = 60;
+                let mounted = 0;
+
+                const mountNext = () => {
+                    const fragment = document.createDocumentFragment();
+                    const end = Math.min(mounted + CHUNK_SIZE, articles.length);
+                    for (let i = mounted; i < end; i++) {
+                        fragment.appendChild(this.renderArticle(articles[i], type, `${sectionId}-${i}`));
+                    }
+                    mounted = end;
+                    return fragment;
+                };
 
-        .section-deleted .section-title {
-            background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%);
-            color: #c62828;
-        }
+                listEl.appendChild(mountNext());
+                if (mounted >= articles.length) {
+                    return;
+                }
 
-        .section-new .section-title {
-            background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%);
-            color: #2e7d32;
-        }
+                const sentinel = document.createElement('div');
+                sentinel.className = 'chunk-sentinel';
+                listEl.appendChild(sentinel);
 
-        .articles-list {
-            display: block;
-            transition: all 0.5s ease;
-        }
+                const observer = new IntersectionObserver(entries => {
+                    if (!entries.some(entry => entry.isIntersecting)) {
+                        return;
+                    }
+                    listEl.insertBefore(mountNext(), sentinel);
+                    if (mounted >= articles.length) {
+                        observer.disconnect();
+                        sentinel.remove();
+                    }
+                }, { rootMargin: '600px 0px' });
+                observer.observe(sentinel);
+                this.chunkObservers.push(observer);
+            }
 
-        .articles-list.collapsed {
-            display: none;
-        }
+            renderArticle(article, type, articleId) {
+                const cached = this.articleNodeCache.get(article);
+                if (cached) {
+                    return cached;
+                }
 
-        .article-item {
-            background: white;
-            border: 1px solid #e9ecef;
-            border-radius: 10px;
-            margin-bottom: 15px;
-            overflow: hidden;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-            transition: all 0.3s ease;
-        }
+                const number = article.article_number || article.old_number || article.new_number;
 
-        .article-item:hover {
-            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
-            transform: translateY(-2px);
-        }
+                const item = document.createElement('div');
+                item.className = 'article-item';
 
-        /* 文本对比高亮样式 */
-        .diff-deleted {
-            background-color: #ffdddd;
-            color: #721c24;
-            padding: 2px 4px;
-            border-radius: 3px;
-            text-decoration: line-through;
-            border: 1px solid #f5c6cb;
-            margin: 0 1px;
-        }
+                const header = document.createElement('div');
+                header.className = 'article-header';
+                header.dataset.articleId = articleId;
 
-        .diff-added {
-            background-color: #d4edda;
-            color: #155724;
-            padding: 2px 4px;
-            border-radius: 3px;
-            border: 1px solid #c3e6cb;
-            margin: 0 1px;
-        }
+                const numberEl = document.createElement('div');
+                numberEl.className = 'article-number';
+                numberEl.textContent = `第${number}条`;
+                header.appendChild(numberEl);
+                header.appendChild(this.renderArticleMeta(article, type));
+                item.appendChild(header);
 
-        /* 增强对比容器样式 */
-        .diff-container {
-            display: flex;
-            gap: 20px;
-            margin: 15px 0;
-        }
+                const content = document.createElement('div');
+                content.className = 'article-content';
+                content.id = `content-${articleId}`;
 
-        .diff-panel {
-            flex: 1;
-            border: 1px solid #dee2e6;
-            border-radius: 8px;
-            overflow: hidden;
-        }
+                // 正文留空，等到第一次展开时再按类型构建
+                this.articleData.set(articleId, { article, type });
 
-        .diff-header {
-            background: #f8f9fa;
-            padding: 10px 15px;
-            font-weight: 600;
-            border-bottom: 1px solid #dee2e6;
-            font-size: 0.9rem;
-            color: #495057;
-        }
+                item.appendChild(content);
+                this.articleNodeCache.set(article, item);
+                return item;
+            }
 
-        .diff-content {
-            padding: 15px;
-            white-space: pre-wrap;
-            line-height: 1.8;
-            font-size: 0.95rem;
-        }
+            buildModifiedBody(content, article) {
+                content.appendChild(this.buildDiffPanels(article));
+                if (article.unified_diff_html) {
+                    const unified = document.createElement('div');
+                    unified.className = 'unified-diff';
+                    const unifiedHeader = document.createElement('div');
+                    unifiedHeader.className = 'unified-diff-header';
+                    unifiedHeader.textContent = '统一对比视图';
+                    const unifiedContent = document.createElement('div');
+                    unifiedContent.className = 'unified-diff-content';
+                    // 差异HTML由Python端生成并转义，可直接插入
+                    unifiedContent.innerHTML = article.unified_diff_html;
+                    unified.appendChild(unifiedHeader);
+                    unified.appendChild(unifiedContent);
+                    content.appendChild(unified);
+                }
+                this.appendChapterInfo(content, article);
+            }
 
+            buildPlainBody(content, article, type) {
+                const text = document.createElement('div');
+                text.className = 'identical-content';
+                text.textContent = article.content || '';
+                content.appendChild(text);
+                if (type !== 'identical') {
+                    this.appendChapterInfo(content, article);
+                }
+            }
 
-        /* 统一对比显示样式 */
-        .unified-diff {
-            background: #f8f9fa;
-            border: 1px solid #dee2e6;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 15px 0;
-            line-height: 1.8;
-            font-size: 0.95rem;
-        }
+            renderArticleMeta(article, type) {
+                const meta = document.createElement('div');
+                meta.className = 'article-meta';
+
+                if (type === 'modified' || type === 'identical') {
+                    // 百分比与档位类名由 Python 侧预先算好
+                    const pct = type === 'identical' ? 100 : article.similarity_pct;
+                    const similarityClass = type === 'identical' ? '' : article.similarity_class;
+                    const badge = document.createElement('span');
+                    badge.className = similarityClass ? `similarity-badge ${similarityClass}` : 'similarity-badge';
+                    badge.textContent = `${pct}%`;
+                    meta.appendChild(badge);
+
+                    const mapping = document.createElement('span');
+                    mapping.className = 'chapter-info';
+                    mapping.textContent = `第${article.old_number}条 → 第${article.new_number}条`;
+                    meta.appendChild(mapping);
+                } else {
+                    const number = article.article_number || article.old_number || article.new_number;
+                    const info = document.createElement('span');
+                    info.className = 'chapter-info';
+                    info.textContent = `第${number}条`;
+                    meta.appendChild(info);
+                }
 
-        .unified-diff-header {
-            font-weight: 600;
-            color: #495057;
-            margin-bottom: 10px;
-            padding-bottom: 10px;
-            border-bottom: 1px solid #dee2e6;
-        }
+                const expandIcon = document.createElement('span');
+                expandIcon.className = 'expand-icon';
+                expandIcon.textContent = '▼';
+                meta.appendChild(expandIcon);
+                return meta;
+            }
 
-        /* 响应式设计 */
-        @media (max-width: 768px) {
-            .diff-container {
-                flex-direction: column;
+            buildDiffPanels(article) {
+                const container = document.createElement('div');
+                container.className = 'diff-container';
+
+                const [oldText, newText] = this.extractDiffTexts(article);
+                const panels = [
+                    ['diff-old', `原版内容（第${article.old_number}条）`, oldText],
+                    ['diff-new', `新版内容（第${article.new_number}条）`, newText]
+                ];
+                for (const [cls, headerText, text] of panels) {
+                    const panel = document.createElement('div');
+                    panel.className = `diff-panel ${cls}`;
+                    const headerEl = document.createElement('div');
+                    headerEl.className = 'diff-header';
+                    headerEl.textContent = headerText;
+                    const bodyEl = document.createElement('div');
+                    bodyEl.className = 'diff-content';
+                    bodyEl.textContent = text || '';
+                    panel.appendChild(headerEl);
+                    panel.appendChild(bodyEl);
+                    container.appendChild(panel);
+                }
+                return container;
             }
-            
-            .diff-panel {
-                margin-bottom: 15px;
+
+            extractDiffTexts(article) {
+                // 为省体积，修改条文一般只随差异HTML下发；
+                // 原文 = 相同段 + 删除段，新文 = 相同段 + 新增段
+                if (article.old_content !== undefined || !article.unified_diff_html) {
+                    return [article.old_content || '', article.new_content || ''];
+                }
+                const holder = document.createElement('div');
+                holder.innerHTML = article.unified_diff_html;
+                let oldText = '';
+                let newText = '';
+                for (const node of holder.childNodes) {
+                    const text = node.textContent;
+                    if (node.nodeType === Node.TEXT_NODE) {
+                        oldText += text;
+                        newText += text;
+                    } else if (node.classList.contains('diff-deleted')) {
+                        oldText += text;
+                    } else if (node.classList.contains('diff-added')) {
+                        newText += text;
+                    }
+                }
+                return [oldText, newText];
             }
-        }
 
-        .article-header {
-            padding: 15px 20px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #e9ecef;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }
+            appendChapterInfo(parent, article) {
+                if (!article.old_chapter_info && !article.new_chapter_info && !article.chapter_info) {
+                    return;
+                }
 
-        .article-number {
-            font-weight: 600;
-            font-size: 1.1rem;
-        }
+                const list = document.createElement('div');
+                list.className = 'changes-list';
+                const title = document.createElement('div');
+                title.className = 'changes-title';
+                title.textContent = '📚 章节信息';
+                list.appendChild(title);
+
+                const addItem = (label, info) => {
+                    const item = document.createElement('div');
+                    item.className = 'change-item';
+                    item.textContent = `${label}：第${info.chapter_num}章《${info.chapter_title}》`;
+                    list.appendChild(item);
+                };
+
+                if (article.old_chapter_info) addItem('原版', article.old_chapter_info);
+                if (article.new_chapter_info) addItem('新版', article.new_chapter_info);
+                if (article.chapter_info) addItem('章节', article.chapter_info);
+
+                parent.appendChild(list);
+            }
 
-        .article-meta {
-            display: flex;
-            gap: 15px;
-            align-items: center;
-        }
+            toggleSection(sectionId) {
+                const collapsed = !this.collapsedSections.has(sectionId);
+                if (collapsed) {
+                    this.collapsedSections.add(sectionId);
+                } else {
+                    this.collapsedSections.delete(sectionId);
+                }
 
-        .similarity-badge {
-            background: #28a745;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 15px;
-            font-size: 0.8rem;
-        }
+                // 只翻转当前分组的折叠类，节点引用在构建时已缓存，无需查询
+                const refs = this.sectionRefs.get(sectionId);
+                if (!refs) {
+                    return;
+                }
+                refs.titleEl.classList.toggle('collapsed', collapsed);
+                refs.listEl.classList.toggle('collapsed', collapsed);
+            }
 
-        .similarity-badge.medium {
-            background: #ffc107;
-            color: #212529;
-        }
+            toggleArticle(articleId) {
+                const content = document.getElementById(`content-${articleId}`);
+                const header = content.previousElementSibling;
 
-        .similarity-badge.low {
-            background: #dc3545;
-        }
+                const expanding = !content.classList.contains('expanded');
+                // 第一次展开时才构建正文；此后折叠/展开复用已建节点。
+                // 按类型一次分发到专用构建方法，参数形状稳定利于 JIT
+                if (expanding && !content.firstChild) {
+                    const entry = this.articleData.get(articleId);
+                    if (entry) {
+                        if (entry.type === 'modified') {
+                            this.buildModifiedBody(content, entry.article);
+                        } else {
+                            this.buildPlainBody(content, entry.article, entry.type);
+                        }
+                    }
+                }
+                content.classList.toggle('expanded', expanding);
+                header.classList.toggle('expanded', expanding);
+            }
 
-        .chapter-info {
-            font-size: 0.9rem;
-            color: #6c757d;
+            showError(message) {
+                // 初始化失败时可能还没缓存节点，这里兜底查一次
+                const contentEl = this.contentEl || document.getElementById('content');
+                contentEl.innerHTML = `
+                    <div style="text-align: center; padding: 50px; color: #dc3545;">
+                        <h3>❌ 错误</h3>
+                        <p>${message}</p>
+                    </div>
+                `;
+            }
         }
 
-        .expand-icon {
-            transition: transform 0.3s ease;
-        }
+        // 全局实例
+        window.comparisonViewer = null;
 
-        .article-header.expanded .expand-icon {
-            transform: rotate(180deg);
-        }
+        // 页面加载完成后初始化
+        document.addEventListener('DOMContentLoaded', () => {
+            window.comparisonViewer = new ComparisonViewer();
+        });
+    </script>
+</body>
+</html>'''
 
-        .article-content {
-            display: none;
-            padding: 20px;
-        }
+_TEMPLATE_HEAD, _TEMPLATE_TAIL = _HTML_TEMPLATE.split('EMBEDDED_DATA_PLACEHOLDER', 1)
 
-        .article-content.expanded {
-            display: block;
-        }
+class LawComparator:
+    """法律条文对比器"""
+    
+    def __init__(self, similarity_threshold: float = 0.8, fast: bool = False):
+        """
+        初始化对比器
+        :param similarity_threshold: 相似度阈值，用于判断条文是否相同
+        :param fast: 是否使用 numba JIT 加速的相似度计算（需安装 numba）
+        """
+        self.similarity_threshold = similarity_threshold
+        self.manual_matches = []  # 存储手动匹配结果
+        self._manual_old = set()  # 手动匹配涉及的原版条文编号
+        self._manual_new = set()  # 手动匹配涉及的新版条文编号
+        self._sim_cache = {}  # 相似度缓存：(低hash, 高hash) -> ratio
+        if fast and not HAS_NUMBA:
+            print("警告：未安装 numba，--fast 模式不可用，回退到默认算法")
+        self.fast = fast and HAS_NUMBA
+        
+    def calculate_similarity(self, text1: str, text2: str, floor: float = 0.0) -> float:
+        """
+        计算两个文本的相似度
+        :param floor: 调用方关心的最低相似度，上界低于它时直接返回 0，省掉完整计算
+        """
+        if not text1 or not text2:
+            return 0.0
+        if text1 == text2:
+            return 1.0
+        # 长度比 2*min/(len1+len2) 是 ratio() 的上界，
+        # 一次整数比较就能否决长度悬殊的文本
+        len1, len2 = len(text1), len(text2)
+        if floor > 0.0 and 2.0 * min(len1, len2) / (len1 + len2) < floor:
+            return 0.0
 
-        .diff-container {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            margin-bottom: 20px;
-        }
+        # ratio() 对调换参数对称，用排序后的哈希对作键，
+        # 同一对文本在重复对比（如加载手动匹配后重跑）时直接命中缓存
+        hash1, hash2 = hash(text1), hash(text2)
+        cache_key = (hash1, hash2) if hash1 <= hash2 else (hash2, hash1)
+        similarity = self._sim_cache.get(cache_key)
+        if similarity is None:
+            similarity = SequenceMatcher(None, text1, text2, autojunk=False).ratio()
+            self._sim_cache[cache_key] = similarity
+        return similarity
+    
+    def find_best_match(self, target_content: str, candidates: List[Tuple[int, str, frozenset]],
+                       used_articles: Set[int]) -> Tuple[int, float]:
+        """
+        为目标条文在候选条文中找到最佳匹配
+        :param target_content: 目标条文内容
+        :param candidates: 候选条文列表 [(条文编号, 条文内容, 字符集合签名)]
+        :param used_articles: 已使用的条文编号集合
+        :return: (最佳匹配的条文编号, 相似度)
+        """
+        best_match_num = -1
+        best_similarity = 0.0
 
-        .diff-panel {
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            overflow: hidden;
-        }
+        target_sig = frozenset(target_content)
 
-        .diff-header {
-            padding: 10px 15px;
-            font-weight: 600;
-            color: white;
-        }
+        # 复用同一个 SequenceMatcher：seq2 固定为目标条文，
+        # 其内部索引（b2j）只构建一次，内层循环仅替换 seq1
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(target_content)
 
-        .diff-old .diff-header {
-            background: #dc3545;
-        }
+        for article_num, candidate_content, candidate_sig in candidates:
+            if article_num in used_articles:
+                continue
 
-        .diff-new .diff-header {
-            background: #28a745;
-        }
+            if not target_content or not candidate_content:
+                continue
 
-        .diff-content {
-            padding: 15px;
-            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-            line-height: 1.8;
-            white-space: pre-wrap;
-            max-height: 300px;
-            overflow-y: auto;
-        }
+            # 完全相同的条文直接判定，跳过 SequenceMatcher
+            if candidate_content == target_content:
+                return article_num, 1.0
 
-        .diff-old .diff-content {
-            background: #fff5f5;
-        }
+            # 字符集合 Jaccard 粗筛：集合交并都是 C 实现，
+            # 远比 ratio() 便宜，可以直接淘汰大部分不相关候选
+            jaccard = len(target_sig & candidate_sig) / len(target_sig | candidate_sig)
+            if jaccard < JACCARD_BLOCK_THRESHOLD:
+                continue
 
-        .diff-new .diff-content {
-            background: #f0fff4;
-        }
+            matcher.set_seq1(candidate_content)
 
-        .highlight-removed {
-            background: #ffdddd;
-            text-decoration: line-through;
-            padding: 2px 4px;
-            border-radius: 3px;
-        }
+            # 先用廉价的相似度上界剪枝，只有可能刷新当前最优
+            # （且达到阈值）时才做完整的 O(n·m) ratio() 计算
+            cutoff = best_similarity if best_similarity > self.similarity_threshold else self.similarity_threshold
+            if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+                continue
 
-        .highlight-added {
-            background: #ddffdd;
-            padding: 2px 4px;
-            border-radius: 3px;
-        }
+            similarity = matcher.ratio()
 
-        .changes-list {
-            margin-top: 15px;
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 8px;
-        }
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_match_num = article_num
 
-        .changes-title {
-            font-weight: 600;
-            margin-bottom: 10px;
-            color: #495057;
-        }
+                # 已经接近完全相同，继续扫描剩余候选纯属浪费
+                if best_similarity >= 0.995:
+                    break
 
-        .change-item {
-            padding: 5px 0;
-            color: #6c757d;
-            font-size: 0.9rem;
-        }
+        return best_match_num, best_similarity
 
-        .identical-content {
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-            line-height: 1.8;
-        }
+    def _best_match_from_matrix(self, score_row, target_content: str,
+                                candidates: List[Tuple[int, str]],
+                                used_articles: Set[int]) -> Tuple[int, float]:
+        """
+        从 rapidfuzz 相似度矩阵的一行中挑选最佳未使用候选
+        :param score_row: 该目标条文对所有候选的相似度得分（0~100）
+        :param target_content: 目标条文内容
+        :param candidates: 候选条文列表 [(条文编号, 条文内容)]
+        :param used_articles: 已使用的条文编号集合
+        :return: (最佳匹配的条文编号, 相似度)
+        """
+        best_match_num = -1
+        best_similarity = 0.0
 
-        .empty-section {
-            text-align: center;
-            padding: 30px;
-            color: #6c757d;
-            font-style: italic;
-        }
+        for j, (article_num, candidate_content, _) in enumerate(candidates):
+            if article_num in used_articles:
+                continue
 
-        @media (max-width: 768px) {
-            .diff-container {
-                grid-template-columns: 1fr;
-            }
-            
-            .stats {
-                flex-direction: column;
-                gap: 15px;
-            }
-            
-            .filters {
-                flex-wrap: wrap;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 法律条文对比结果</h1>
-            <p>智能对比分析，支持差异展示与详细查看</p>
-        </div>
+            score = score_row[j] / 100.0
+            if score > best_similarity:
+                best_similarity = score
+                best_match_num = article_num
+                best_content = candidate_content
 
-        <div class="metadata" id="metadata">
-            <!-- 元数据将在这里动态生成 -->
-        </div>
+        # 用 SequenceMatcher 复算最终相似度，与回退路径保持同一口径
+        if best_match_num != -1:
+            best_similarity = self.calculate_similarity(target_content, best_content)
 
-        <div class="stats" id="stats">
-            <div class="stat-item identical">
-                <div class="stat-number" id="identicalCount">0</div>
-                <div class="stat-label">相同条文</div>
-            </div>
-            <div class="stat-item modified">
-                <div class="stat-number" id="modifiedCount">0</div>
-                <div class="stat-label">修改条文</div>
-            </div>
-            <div class="stat-item deleted">
-                <div class="stat-number" id="deletedCount">0</div>
-                <div class="stat-label">删除条文</div>
-            </div>
-            <div class="stat-item new">
-                <div class="stat-number" id="newCount">0</div>
-                <div class="stat-label">新增条文</div>
-            </div>
-        </div>
+        return best_match_num, best_similarity
 
-        <div class="filters" id="filters">
-            <span>显示类型：</span>
-            <button class="filter-button active" data-filter="all">全部</button>
-            <button class="filter-button" data-filter="modified">修改条文</button>
-            <button class="filter-button" data-filter="identical">相同条文</button>
-            <button class="filter-button" data-filter="deleted">删除条文</button>
-            <button class="filter-button" data-filter="new">新增条文</button>
-        </div>
+    def _find_best_match_fast(self, target_codes, candidate_codes: List[Tuple[int, Any]],
+                              used_articles: Set[int]) -> Tuple[int, float]:
+        """
+        --fast 模式：用 numba JIT 的编辑距离内核在码点数组上找最佳匹配
+        :param target_codes: 目标条文内容的 int32 码点数组
+        :param candidate_codes: 候选条文列表 [(条文编号, 码点数组)]
+        :param used_articles: 已使用的条文编号集合
+        :return: (最佳匹配的条文编号, 相似度)
+        """
+        best_match_num = -1
+        best_similarity = 0.0
 
-        <div class="content" id="content">
-            <!-- 内容将在这里动态生成 -->
-        </div>
-    </div>
+        for article_num, codes in candidate_codes:
+            if article_num in used_articles:
+                continue
 
-    <script>
-        // 嵌入的比较数据
-        const COMPARISON_DATA = EMBEDDED_DATA_PLACEHOLDER;
+            similarity = _levenshtein_ratio(target_codes, codes)
 
-        class ComparisonViewer {
-            constructor() {
-                this.data = COMPARISON_DATA;
-                this.currentFilter = 'all';
-                this.collapsedSections = new Set();
-                
-                // 数据验证
-                if (!this.data || !this.data.comparison_result) {
-                    console.error('数据格式错误:', this.data);
-                    return;
-                }
-                
-                this.init();
-            }
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_match_num = article_num
 
-            init() {
-                try {
-                    console.log('初始化比较查看器...', this.data);
-                    this.setupEventListeners();
-                    this.renderMetadata();
-                    this.renderStats();
-                    this.renderContent();
-                    console.log('比较查看器初始化完成');
-                } catch (error) {
-                    console.error('初始化失败:', error);
-                }
-            }
+        return best_match_num, best_similarity
 
-            setupEventListeners() {
-                document.querySelectorAll('.filter-button').forEach(button => {
-                    button.addEventListener('click', (e) => {
-                        this.setFilter(e.target.dataset.filter);
-                    });
-                });
-            }
+    @staticmethod
+    def _encode_codepoints(text: str):
+        """把字符串编码成 int32 码点数组，供 JIT 内核使用"""
+        return np.frombuffer(text.encode('utf-32-le'), dtype=np.int32)
 
-            setFilter(filter) {
-                this.currentFilter = filter;
-                
-                document.querySelectorAll('.filter-button').forEach(btn => {
-                    btn.classList.remove('active');
-                });
-                document.querySelector(`[data-filter="${filter}"]`).classList.add('active');
-                
-                this.renderContent();
-            }
+    @staticmethod
+    def _cache_article_contents(articles: Dict[int, Dict[str, Any]]):
+        """把条文内容缓存为 '_content' 键，供热路径免 .get 访问"""
+        for article_info in articles.values():
+            article_info['_content'] = article_info.get('content', '')
 
-            renderMetadata() {
-                const metadata = this.data.metadata;
-                const metadataEl = document.getElementById('metadata');
+    def intelligent_article_matching(self, articles1: Dict[int, Dict[str, Any]], 
+                                   articles2: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        智能条文匹配算法（支持手动匹配优先）
+        优先使用手动匹配结果，然后基于内容相似度进行匹配
+        """
+        print("正在执行智能条文匹配...")
+        
+        # 把内容字符串缓存到条文字典上，后续热路径全部直接取 '_content'，
+        # 省去每次访问的 .get 方法调用和默认值分配（重复调用无副作用）
+        self._cache_article_contents(articles1)
+        self._cache_article_contents(articles2)
+
+        # 匹配结果
+        matches = []  # [(article1_num, article2_num, similarity, match_type)]
+        used_articles1 = set()  # 已匹配的第一版本条文
+        used_articles2 = set()  # 已匹配的第二版本条文
+        
+        # 第0阶段：处理手动匹配结果
+        manual_matches_processed = 0
+        if self.manual_matches:
+            print(f"优先处理 {len(self.manual_matches)} 个手动匹配关系...")
+            
+            for match in self.manual_matches:
+                old_num = int(match['old_number'])
+                new_num = int(match['new_number'])
                 
-                metadataEl.innerHTML = `
-                    <div class="metadata-item">
-                        <span class="metadata-label">原版文件：</span>
-                        ${metadata.law1_file}
-                    </div>
-                    <div class="metadata-item">
-                        <span class="metadata-label">新版文件：</span>
-                        ${metadata.law2_file}
-                    </div>
-                `;
-            }
+                # 检查条文是否存在
+                if old_num in articles1 and new_num in articles2:
+                    # 计算相似度
+                    similarity = self.calculate_similarity(
+                        articles1[old_num]['_content'],
+                        articles2[new_num]['_content']
+                    )
+                    
+                    matches.append((old_num, new_num, similarity, 'manual'))
+                    used_articles1.add(old_num)
+                    used_articles2.add(new_num)
+                    manual_matches_processed += 1
+                    print(f"  手动匹配：第{old_num}条 → 第{new_num}条 (相似度: {similarity:.3f})")
+                else:
+                    print(f"  警告：手动匹配中的条文不存在 - 第{old_num}条 或 第{new_num}条")
+            
+            print(f"手动匹配处理完成，成功处理 {manual_matches_processed} 个匹配关系")
+        
+        # 第一阶段：为剩余版本1中的每个条文找到版本2中的最佳匹配
+        # 不再复制 remaining 字典，直接用已匹配集合在原字典上过滤
+        print(f"智能匹配剩余条文：{len(articles1) - len(used_articles1)} 个原条文，"
+              f"{len(articles2) - len(used_articles2)} 个新条文")
+
+        # 预先缓存候选条文内容和字符集合签名，
+        # 避免在 O(N×M) 内层循环中重复做字典查找和集合构建
+        candidates2 = [(num, content, frozenset(content))
+                       for num, content in ((num, info['_content'])
+                                            for num, info in articles2.items()
+                                            if num not in used_articles2)]
+
+        sorted_nums1 = sorted(num for num in articles1 if num not in used_articles1)
+        target_contents = [articles1[num]['_content'] for num in sorted_nums1]
+
+        # 有 rapidfuzz 时一次性批量计算 N×M 相似度矩阵（原生代码 + 多线程）
+        score_matrix = None
+        if HAS_RAPIDFUZZ and target_contents and candidates2:
+            score_matrix = rf_process.cdist(
+                target_contents, [content for _, content, _ in candidates2],
+                scorer=rf_fuzz.ratio, workers=-1
+            )
 
-            renderStats() {
-                const result = this.data.comparison_result;
-                document.getElementById('identicalCount').textContent = (result.identical || []).length;
-                document.getElementById('modifiedCount').textContent = (result.modified || []).length;
-                document.getElementById('deletedCount').textContent = (result.deleted || []).length;
-                document.getElementById('newCount').textContent = (result.new || []).length;
-            }
+        # --fast 模式：每条内容只编码一次码点数组，内层循环直接调 JIT 内核
+        candidate_codes = None
+        target_codes = None
+        if self.fast and score_matrix is None:
+            candidate_codes = [(num, self._encode_codepoints(content)) for num, content, _ in candidates2]
+            target_codes = [self._encode_codepoints(content) for content in target_contents]
+
+        # 其余情况：配对数足够大时用进程池并行算出相似度矩阵，
+        # 只并行二次方的计算部分，匹配选择仍顺序执行以保证确定性
+        score_rows = None
+        if (score_matrix is None and candidate_codes is None
+                and len(sorted_nums1) * len(candidates2) >= PARALLEL_MIN_PAIRS):
+            cand_contents = [content for _, content, _ in candidates2]
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                score_rows = list(executor.map(
+                    partial(_score_row, cand_contents=cand_contents), target_contents
+                ))
+
+        # 矩阵可用且装有 scipy 时，先做一次全局最优指派
+        assignment = None
+        if score_matrix is not None and HAS_SCIPY:
+            row_ind, col_ind = linear_sum_assignment(score_matrix, maximize=True)
+            assignment = dict(zip(row_ind.tolist(), col_ind.tolist()))
+
+        for i, article1_num in enumerate(sorted_nums1):
+            target_content = target_contents[i]
+
+            if assignment is not None:
+                j = assignment.get(i, -1)
+                if j != -1 and score_matrix[i][j] / 100.0 >= self.similarity_threshold:
+                    best_match_num = candidates2[j][0]
+                    best_similarity = self.calculate_similarity(target_content, candidates2[j][1])
+                else:
+                    best_match_num, best_similarity = -1, 0.0
+            elif candidate_codes is not None:
+                best_match_num, best_similarity = self._find_best_match_fast(
+                    target_codes[i], candidate_codes, used_articles2
+                )
+            elif score_matrix is not None:
+                best_match_num, best_similarity = self._best_match_from_matrix(
+                    score_matrix[i], target_content, candidates2, used_articles2
+                )
+            elif score_rows is not None:
+                best_match_num, best_similarity = -1, 0.0
+                row = score_rows[i]
+                for j, (article_num, _, _) in enumerate(candidates2):
+                    if article_num in used_articles2:
+                        continue
+                    if row[j] > best_similarity:
+                        best_similarity = row[j]
+                        best_match_num = article_num
+            else:
+                # 修订通常保持条号稳定或小幅平移：按编号距离升序扫描候选，
+                # 配合近似完全匹配的提前退出，多数条文只需比较一两次
+                candidates_by_dist = sorted(
+                    candidates2, key=lambda cand: abs(cand[0] - article1_num)
+                )
+                best_match_num, best_similarity = self.find_best_match(
+                    target_content, candidates_by_dist, used_articles2
+                )
+            
+            if best_match_num != -1 and best_similarity >= self.similarity_threshold:
+                matches.append((article1_num, best_match_num, best_similarity, 'auto'))
+                used_articles2.add(best_match_num)
+                print(f"  智能匹配：第{article1_num}条 → 第{best_match_num}条 (相似度: {best_similarity:.3f})")
+            else:
+                matches.append((article1_num, -1, 0.0, 'none'))  # 没有找到匹配，标记为删除
+        
+        # 第二阶段：处理版本2中未匹配的条文（新增条文）
+        new_articles = []
+        for article2_num in sorted(articles2.keys()):
+            if article2_num not in used_articles2:
+                new_articles.append(article2_num)
+                print(f"  新增：第{article2_num}条")
+        
+        print(f"匹配统计：{manual_matches_processed} 个手动匹配，{len([m for m in matches if m[3] == 'auto'])} 个智能匹配")
+        
+        return {
+            'matches': matches,
+            'new': new_articles,
+            'used_articles2': used_articles2,
+            'manual_matches_count': manual_matches_processed
+        }
+    
+    def compare_articles(self, law1: Dict[str, Any], law2: Dict[str, Any]) -> Dict[str, Any]:
+        """比较两个法律版本的条文"""
+        print("正在比较法律条文...")
+        
+        articles1 = law1.get('articles', {})
+        articles2 = law2.get('articles', {})
 
-            renderContent() {
-                const contentEl = document.getElementById('content');
-                const result = this.data.comparison_result;
-                
-                let html = '';
+        # 缓存内容字符串（intelligent_article_matching 内部同样依赖该缓存）
+        self._cache_article_contents(articles1)
+        self._cache_article_contents(articles2)
 
-                if (this.currentFilter === 'all' || this.currentFilter === 'modified') {
-                    html += this.renderSection('modified', '修改的条文', result.modified || [], 'modified');
-                }
-                
-                if (this.currentFilter === 'all' || this.currentFilter === 'identical') {
-                    html += this.renderSection('identical', '相同的条文', result.identical || [], 'identical');
-                }
-                
-                if (this.currentFilter === 'all' || this.currentFilter === 'deleted') {
-                    html += this.renderSection('deleted', '删除的条文', result.deleted || [], 'deleted');
-                }
+        # 章节字典在循环里不变，提前绑定，避免每次匹配都重走 .get 链
+        chapters1 = law1.get('chapters', {})
+        sections1 = law1.get('sections', {})
+        chapters2 = law2.get('chapters', {})
+        sections2 = law2.get('sections', {})
+        
+        # 执行智能匹配
+        matching_result = self.intelligent_article_matching(articles1, articles2)
+        
+        comparison_result = {
+            'identical': [],      # 完全相同的条文
+            'modified': [],       # 修改的条文
+            'new': [],   # 新增的条文
+            'deleted': [], # 删除的条文
+            'mapping': {}         # 条文编号映射关系
+        }
+        
+        # 统计信息
+        stats = {
+            'total_articles_v1': len(articles1),
+            'total_articles_v2': len(articles2),
+            'identical_count': 0,
+            'modified_count': 0,
+            'new_count': 0,
+            'deleted_count': 0
+        }
+        
+        # 处理匹配结果
+        manual_count = 0
+        auto_count = 0
+        
+        for article1_num, article2_num, similarity, match_type in matching_result['matches']:
+            
+            if match_type == 'manual':
+                manual_count += 1
+            elif match_type == 'auto':
+                auto_count += 1
+            
+            if article2_num == -1:
+                # 删除的条文
+                article1_info = articles1[article1_num]
+                # 收集章节信息
+                chapter_info = self._build_chapter_info(article1_info, chapters1, sections1)
+                comparison_result['deleted'].append(DeletedRecord(
+                    article_number=article1_num,
+                    content=article1_info['_content'],
+                    chapter_info=chapter_info
+                ))
+                stats['deleted_count'] += 1
+            else:
+                # 建立映射关系
+                comparison_result['mapping'][article1_num] = article2_num
                 
-                if (this.currentFilter === 'all' || this.currentFilter === 'new') {
-                    html += this.renderSection('new', '新增的条文', result.new || [], 'new');
-                }
-
-                contentEl.innerHTML = html;
-            }
-
-            renderSection(sectionId, title, articles, type) {
-                if (!articles || articles.length === 0) {
-                    return `
-                        <div class="section section-${type}">
-                            <div class="section-title">
-                                <span>${title} (0)</span>
-                                <span class="toggle-icon">▼</span>
-                            </div>
-                            <div class="articles-list">
-                                <div class="empty-section">暂无${title.replace('的条文', '')}条文</div>
-                            </div>
-                        </div>
-                    `;
-                }
-
-                const isCollapsed = this.collapsedSections.has(sectionId);
-                const articlesHtml = articles.map((article, index) => {
-                    return this.renderArticle(article, type, `${sectionId}-${index}`);
-                }).join('');
-
-                return `
-                    <div class="section section-${type}">
-                        <div class="section-title ${isCollapsed ? 'collapsed' : ''}" 
-                             onclick="window.comparisonViewer && window.comparisonViewer.toggleSection('${sectionId}')">
-                            <span>${title} (${articles.length})</span>
-                            <span class="toggle-icon">▼</span>
-                        </div>
-                        <div class="articles-list ${isCollapsed ? 'collapsed' : ''}">
-                            ${articlesHtml}
-                        </div>
-                    </div>
-                `;
-            }
-
-            renderArticle(article, type, articleId) {
-                const similarity = article.similarity || 1.0;
-                const similarityClass = similarity >= 0.9 ? '' : similarity >= 0.7 ? 'medium' : 'low';
+                content1 = articles1[article1_num]['_content']
+                content2 = articles2[article2_num]['_content']
                 
-                let headerInfo = '';
-                let contentHtml = '';
-
-                if (type === 'modified') {
-                    headerInfo = `
-                        <div class="article-meta">
-                            <span class="similarity-badge ${similarityClass}">
-                                ${Math.round(similarity * 100)}%
-                            </span>
-                            <span class="chapter-info">
-                                第${article.old_number}条 → 第${article.new_number}条
-                            </span>
-                            <span class="expand-icon">▼</span>
-                        </div>
-                    `;
-                    
-                    // 原版内容和新版内容面板只显示纯文本
-                    let diffContent = `
-                        <div class="diff-container">
-                            <div class="diff-panel diff-old">
-                                <div class="diff-header">原版内容（第${article.old_number}条）</div>
-                                <div class="diff-content">${this.escapeHtml(article.old_content)}</div>
-                            </div>
-                            <div class="diff-panel diff-new">
-                                <div class="diff-header">新版内容（第${article.new_number}条）</div>
-                                <div class="diff-content">${this.escapeHtml(article.new_content)}</div>
-                            </div>
-                        </div>
-                    `;
-                    
-                    // 添加统一对比视图
-                    let unifiedDiff = '';
-                    if (article.unified_diff_html) {
-                        unifiedDiff = `
-                            <div class="unified-diff">
-                                <div class="unified-diff-header">统一对比视图</div>
-                                <div class="unified-diff-content">${article.unified_diff_html}</div>
-                            </div>
-                        `;
-                    }
-                    
-                    contentHtml = `
-                        ${diffContent}
-                        ${unifiedDiff}
-                        ${this.renderChapterInfo(article)}
-                    `;
-                } else if (type === 'identical') {
-                    headerInfo = `
-                        <div class="article-meta">
-                            <span class="similarity-badge">100%</span>
-                            <span class="chapter-info">
-                                第${article.old_number}条 → 第${article.new_number}条
-                            </span>
-                            <span class="expand-icon">▼</span>
-                        </div>
-                    `;
-                    
-                    contentHtml = `
-                        <div class="identical-content">${this.escapeHtml(article.content)}</div>
-                    `;
-                } else {
-                    const number = article.article_number || article.old_number || article.new_number;
-                    headerInfo = `
-                        <div class="article-meta">
-                            <span class="chapter-info">第${number}条</span>
-                            <span class="expand-icon">▼</span>
-                        </div>
-                    `;
+                if similarity >= 0.98:  # 几乎完全相同
+                    comparison_result['identical'].append(IdenticalRecord(
+                        old_number=article1_num,
+                        new_number=article2_num,
+                        content=content1,
+                        similarity=similarity,
+                        match_type=match_type
+                    ))
+                    stats['identical_count'] += 1
+                else:
+                    # 收集章节信息
+                    old_chapter_info = self._build_chapter_info(articles1[article1_num], chapters1, sections1)
+                    new_chapter_info = self._build_chapter_info(articles2[article2_num], chapters2, sections2)
                     
-                    contentHtml = `
-                        <div class="identical-content">${this.escapeHtml(article.content)}</div>
-                        ${this.renderChapterInfo(article)}
-                    `;
-                }
+                    # 修改的条文（统一对比视图延迟到生成HTML报告时再渲染）
+                    comparison_result['modified'].append(ModifiedRecord(
+                        old_number=article1_num,
+                        new_number=article2_num,
+                        old_content=content1,
+                        new_content=content2,
+                        similarity=similarity,
+                        match_type=match_type,
+                        old_chapter_info=old_chapter_info,
+                        new_chapter_info=new_chapter_info,
+                        similarity_pct=round(similarity * 100),
+                        similarity_class='' if similarity >= 0.9 else 'medium' if similarity >= 0.7 else 'low'
+                    ))
+                    stats['modified_count'] += 1
+        
+        # 处理新增条文
+        for article2_num in matching_result['new']:
+            article2_info = articles2[article2_num]
+            # 收集章节信息
+            chapter_info = self._build_chapter_info(article2_info, chapters2, sections2)
+            comparison_result['new'].append(NewRecord(
+                article_number=article2_num,
+                content=article2_info['_content'],
+                chapter_info=chapter_info
+            ))
+            stats['new_count'] += 1
+        
+        # 排序结果
+        comparison_result['identical'].sort(key=lambda x: x.old_number)
+        comparison_result['modified'].sort(key=lambda x: x.old_number)
+        comparison_result['new'].sort(key=lambda x: x.article_number)
+        comparison_result['deleted'].sort(key=lambda x: x.article_number)
+        
+        # 添加匹配方式统计
+        stats['manual_matches_count'] = manual_count
+        stats['auto_matches_count'] = auto_count
+        
+        comparison_result['statistics'] = stats
+        
+        print(f"智能对比完成：")
+        print(f"  相同条文: {stats['identical_count']} 条")
+        print(f"  修改条文: {stats['modified_count']} 条")
+        print(f"  新增条文: {stats['new_count']} 条")
+        print(f"  删除条文: {stats['deleted_count']} 条")
+        print(f"  匹配方式: {manual_count} 个手动匹配, {auto_count} 个智能匹配")
+        
+        return comparison_result
+    
+    def generate_unified_html_diff(self, old_text: str, new_text: str) -> str:
+        """生成统一格式的HTML对比（委托给模块级实现）"""
+        return _unified_diff_html(old_text, new_text)
 
-                const number = article.article_number || article.old_number || article.new_number;
-                
-                return `
-                    <div class="article-item">
-                        <div class="article-header" onclick="window.comparisonViewer && window.comparisonViewer.toggleArticle('${articleId}')">
-                            <div class="article-number">第${number}条</div>
-                            ${headerInfo}
-                        </div>
-                        <div class="article-content" id="content-${articleId}">
-                            ${contentHtml}
-                        </div>
-                    </div>
-                `;
-            }
+    def _ensure_unified_diffs(self, comparison_data: Dict[str, Any]):
+        """
+        按需补齐修改条文的统一对比视图
+        对比阶段不再内联生成 diff HTML，只有真正产出HTML报告时才渲染；
+        数量大时用进程池并行渲染
+        """
+        pending = [m for m in comparison_data.get('modified', [])
+                   if not m.unified_diff_html]
+        if not pending:
+            return
+
+        old_texts = [m.old_content for m in pending]
+        new_texts = [m.new_content for m in pending]
+
+        if len(pending) >= 64:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                rendered = list(executor.map(_unified_diff_html, old_texts, new_texts,
+                                             chunksize=32))
+        else:
+            rendered = [_unified_diff_html(o, n) for o, n in zip(old_texts, new_texts)]
 
+        for m, diff_html in zip(pending, rendered):
+            m.unified_diff_html = diff_html
 
+    @staticmethod
+    def _build_chapter_info(article_info: Dict[str, Any], chapters: Dict[int, Dict[str, Any]],
+                            sections: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """组装条文所属的章节信息（每个字典只查一次）"""
+        chapter = chapters.get(article_info.get('chapter_num'))
+        section = sections.get(article_info.get('section_num'))
+        return {
+            'chapter_num': article_info.get('chapter_num'),
+            'chapter_title': chapter.get('title', '') if chapter else '',
+            'section_num': article_info.get('section_num'),
+            'section_title': section.get('title', '') if section else ''
+        }
 
-            renderChapterInfo(article) {
-                if (!article.old_chapter_info && !article.new_chapter_info && !article.chapter_info) {
-                    return '';
-                }
-                
-                let chapterHtml = '<div class="changes-list"><div class="changes-title">📚 章节信息</div>';
-                
-                if (article.old_chapter_info) {
-                    const oldChapter = article.old_chapter_info;
-                    chapterHtml += `<div class="change-item">原版：第${oldChapter.chapter_num}章《${oldChapter.chapter_title}》</div>`;
-                }
-                
-                if (article.new_chapter_info) {
-                    const newChapter = article.new_chapter_info;
-                    chapterHtml += `<div class="change-item">新版：第${newChapter.chapter_num}章《${newChapter.chapter_title}》</div>`;
-                }
-                
-                if (article.chapter_info) {
-                    const chapter = article.chapter_info;
-                    chapterHtml += `<div class="change-item">章节：第${chapter.chapter_num}章《${chapter.chapter_title}》</div>`;
-                }
-                
-                chapterHtml += '</div>';
-                return chapterHtml;
-            }
+    def _format_chapter_info(self, old_chapter_info: Dict[str, Any] = None, new_chapter_info: Dict[str, Any] = None) -> str:
+        """格式化章节信息"""
+        def format_single_chapter(info):
+            if not info:
+                return "未知"
+            
+            chapter_part = f"第{info.get('chapter_num', '?')}章"
+            if info.get('chapter_title'):
+                chapter_part += f"《{info['chapter_title']}》"
+            
+            if info.get('section_num'):
+                section_part = f"第{info['section_num']}节"
+                if info.get('section_title'):
+                    section_part += f"《{info['section_title']}》"
+                return f"{chapter_part} - {section_part}"
+            
+            return chapter_part
+        
+        if old_chapter_info and new_chapter_info:
+            old_formatted = format_single_chapter(old_chapter_info)
+            new_formatted = format_single_chapter(new_chapter_info)
+            if old_formatted == new_formatted:
+                return old_formatted
+            else:
+                return f"{old_formatted} → {new_formatted}"
+        elif old_chapter_info:
+            return format_single_chapter(old_chapter_info)
+        elif new_chapter_info:
+            return format_single_chapter(new_chapter_info)
+        else:
+            return ""
+    
+    @staticmethod
+    def _serializable_result(comparison_data: Dict[str, Any],
+                             drop_raw_contents: bool = False) -> Dict[str, Any]:
+        """
+        把记录数据类转换成可JSON序列化的普通字典结构
+        :param drop_raw_contents: 统一对比HTML已包含原文/新文全部内容时，
+            去掉修改条文里冗余的 old_content/new_content（仅用于内嵌HTML的
+            数据，查看器会从差异HTML反推两栏文本；数据文件保留原始字段）
+        """
+        serializable = {}
+        for key, value in comparison_data.items():
+            if isinstance(value, list):
+                items = [asdict(item) if hasattr(item, '__dataclass_fields__') else item
+                         for item in value]
+                if drop_raw_contents and key == 'modified':
+                    for item in items:
+                        if item.get('unified_diff_html'):
+                            item.pop('old_content', None)
+                            item.pop('new_content', None)
+                serializable[key] = items
+            else:
+                serializable[key] = value
+        return serializable
 
-            toggleSection(sectionId) {
-                if (this.collapsedSections.has(sectionId)) {
-                    this.collapsedSections.delete(sectionId);
-                } else {
-                    this.collapsedSections.add(sectionId);
-                }
-                this.renderContent();
-            }
+    def save_comparison_data(self, comparison_data: Dict[str, Any], 
+                           law1_info: Dict[str, Any], law2_info: Dict[str, Any],
+                           output_file: str = "法律条文对比数据.json"):
+        """保存对比数据到JSON文件"""
+        full_comparison = {
+            'metadata': {
+                'law1_file': os.path.basename(law1_info.get('file_path', '未知')),
+                'law2_file': os.path.basename(law2_info.get('file_path', '未知')),
+            },
+            'comparison_result': self._serializable_result(comparison_data),
+            'law1_metadata': law1_info.get('metadata', {}),
+            'law2_metadata': law2_info.get('metadata', {})
+        }
+        
+        try:
+            if HAS_ORJSON:
+                with open(output_file, 'wb', buffering=1 << 20) as f:
+                    f.write(orjson.dumps(full_comparison,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    json.dump(full_comparison, f, ensure_ascii=False, indent=2)
+            print(f"对比数据已保存到: {output_file}")
+        except Exception as e:
+            print(f"保存对比数据时出错: {e}")
+    
+    def load_manual_matches(self, manual_matches_file: str) -> bool:
+        """
+        加载手动匹配结果
+        :param manual_matches_file: 手动匹配结果JSON文件路径
+        :return: 是否加载成功
+        """
+        try:
+            with open(manual_matches_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                self.manual_matches = data.get('manual_matches', [])
+                # 预生成编号集合，让 is_manually_matched 查询为 O(1)
+                self._manual_old = {int(m['old_number']) for m in self.manual_matches}
+                self._manual_new = {int(m['new_number']) for m in self.manual_matches}
+                print(f"已加载 {len(self.manual_matches)} 个手动匹配关系")
+                return True
+        except FileNotFoundError:
+            print(f"手动匹配文件未找到: {manual_matches_file}")
+            return False
+        except Exception as e:
+            print(f"加载手动匹配文件时出错: {e}")
+            return False
+    
+    def is_manually_matched(self, old_number: int = None, new_number: int = None) -> bool:
+        """
+        检查指定条文是否已被手动匹配
+        :param old_number: 原版本条文编号
+        :param new_number: 新版本条文编号
+        :return: 是否已被手动匹配
+        """
+        if old_number is not None and int(old_number) in self._manual_old:
+            return True
+        if new_number is not None and int(new_number) in self._manual_new:
+            return True
+        return False
 
-            toggleArticle(articleId) {
-                const content = document.getElementById(`content-${articleId}`);
-                const header = content.previousElementSibling;
-                
-                if (content.classList.contains('expanded')) {
-                    content.classList.remove('expanded');
-                    header.classList.remove('expanded');
-                } else {
-                    content.classList.add('expanded');
-                    header.classList.add('expanded');
-                }
-            }
+    def generate_html_report(self, comparison_data: Dict[str, Any], 
+                           law1_info: Dict[str, Any], law2_info: Dict[str, Any],
+                           output_file: str = "法律条文对比结果.html"):
+        """生成HTML格式的对比报告"""
 
-            escapeHtml(text) {
-                if (!text) return '';
-                const div = document.createElement('div');
-                div.textContent = text;
-                return div.innerHTML;
-            }
-            
-            showError(message) {
-                const contentEl = document.getElementById('content');
-                contentEl.innerHTML = `
-                    <div style="text-align: center; padding: 50px; color: #dc3545;">
-                        <h3>❌ 错误</h3>
-                        <p>${message}</p>
-                    </div>
-                `;
-            }
-        }
+        # 补齐延迟渲染的统一对比视图
+        self._ensure_unified_diffs(comparison_data)
 
-        // 全局实例
-        window.comparisonViewer = null;
+        # 构建完整的比较数据
+        full_comparison = {
+            'metadata': {
+                'law1_file': os.path.basename(law1_info.get('file_path', '未知')),
+                'law2_file': os.path.basename(law2_info.get('file_path', '未知')),
+            },
+            'comparison_result': self._serializable_result(comparison_data,
+                                                           drop_raw_contents=True)
+        }
 
-        // 页面加载完成后初始化
-        document.addEventListener('DOMContentLoaded', () => {
-            window.comparisonViewer = new ComparisonViewer();
-        });
-    </script>
-</body>
-</html>'''
-        
-        # 将数据嵌入HTML
-        data_json = json.dumps(full_comparison, ensure_ascii=False, indent=2)
-        html_content = html_template.replace('EMBEDDED_DATA_PLACEHOLDER', data_json)
-        
+        # 流式写出：模板头 + 直接序列化到文件的JSON数据 + 模板尾，
+        # 避免在内存中再拼出一份完整的HTML大字符串
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # 内嵌数据只给 JS 解析，用紧凑格式省掉缩进空白，
+            # 文件更小、浏览器解析也更快（可读的 JSON 在数据文件里）
+            # "</" 在 JSON 字符串里合法地写成 "<\/"，转义后正文中的
+            # "</script>" 不会提前终结 application/json 数据块
+            if HAS_ORJSON:
+                payload = orjson.dumps(full_comparison, option=orjson.OPT_NON_STR_KEYS)
+                with open(output_file, 'wb', buffering=1 << 20) as f:
+                    f.write(_TEMPLATE_HEAD.encode('utf-8'))
+                    f.write(payload.replace(b'</', b'<\\/'))
+                    f.write(_TEMPLATE_TAIL.encode('utf-8'))
+            else:
+                payload = json.dumps(full_comparison, ensure_ascii=False, separators=(',', ':'))
+                with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write(_TEMPLATE_HEAD)
+                    f.write(payload.replace('</', '<\\/'))
+                    f.write(_TEMPLATE_TAIL)
             print(f"HTML对比报告已保存到: {output_file}")
         except Exception as e:
             print(f"保存HTML报告时出错: {e}")
@@ -1226,6 +1821,7 @@ def main():
     parser.add_argument('law1', help='第一个法律文件路径')
     parser.add_argument('law2', help='第二个法律文件路径')
     parser.add_argument('-t', '--threshold', type=float, default=0.8, help='相似度阈值 (默认: 0.8)')
+    parser.add_argument('--fast', action='store_true', help='使用 numba JIT 加速相似度计算（需安装 numba）')
     parser.add_argument('--no-html', action='store_true', help='不生成HTML报告')
     parser.add_argument('--no-json', action='store_true', help='不保存JSON数据')
     parser.add_argument('-m', '--manual-matches', help='手动匹配JSON文件路径')
@@ -1235,7 +1831,7 @@ def main():
     
     # 初始化解析器和对比器
     law_parser = LawParser()
-    comparator = LawComparator(similarity_threshold=args.threshold)
+    comparator = LawComparator(similarity_threshold=args.threshold, fast=args.fast)
     
     # 加载手动匹配（如果提供）
     if args.manual_matches:
@@ -1251,18 +1847,31 @@ def main():
         # 执行对比
         comparison_result = comparator.compare_articles(law1_data, law2_data)
         
-        # 生成报告
+        # 生成报告：两份输出互不依赖且以写文件为主，
+        # 先补齐统一对比视图，再用线程池并行写出
         generated_files = []
-        
+        output_tasks = []
+
         if not args.no_html:
             html_file = f"{args.output_prefix}结果.html"
-            comparator.generate_html_report(comparison_result, law1_data, law2_data, html_file)
+            output_tasks.append((comparator.generate_html_report, html_file))
             generated_files.append(html_file)
-        
+
         if not args.no_json:
             json_file = f"{args.output_prefix}数据.json"
-            comparator.save_comparison_data(comparison_result, law1_data, law2_data, json_file)
+            output_tasks.append((comparator.save_comparison_data, json_file))
             generated_files.append(json_file)
+
+        if len(output_tasks) > 1:
+            comparator._ensure_unified_diffs(comparison_result)
+            with ThreadPoolExecutor(max_workers=len(output_tasks)) as executor:
+                futures = [executor.submit(write, comparison_result, law1_data, law2_data, path)
+                           for write, path in output_tasks]
+                for future in futures:
+                    future.result()
+        else:
+            for write, path in output_tasks:
+                write(comparison_result, law1_data, law2_data, path)
         
         print(f"\n✅ 智能对比完成！生成的文件：")
         for file in generated_files:
@@ -4,30 +4,142 @@
 import re
 import json
 import argparse
+import heapq
+import mmap
 import os
-from typing import Dict, List, Any
+import sys
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+# orjson 为可选依赖：Rust 实现的 JSON 序列化，对中文文本（原生 UTF-8）
+# 比标准库 json 快数倍；未安装时回退标准库
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# regex 为可选依赖：接口与 re 兼容，其引擎对带命名组的择一模式
+# （行分发正则）匹配更快；未安装时回退标准库 re
+try:
+    import regex as _re_engine
+    HAS_REGEX = True
+except ImportError:
+    _re_engine = re
+    HAS_REGEX = False
+
+# 基础中文数字映射（模块级常量，供缓存的解析函数使用）
+_CHINESE_BASE_NUMBERS = {
+    # 基础数字
+    '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
+    '六': 6, '七': 7, '八': 8, '九': 9,
+    # 数位
+    '十': 10, '百': 100, '千': 1000, '万': 10000
+}
+
+# 半角到全角标点映射表：translate 一次C层扫描完成全部替换
+_PUNCT_TRANS = str.maketrans({
+    ',': '，',    # 逗号
+    '.': '。',    # 句号
+    ';': '；',    # 分号
+    ':': '：',    # 冒号
+    '?': '？',    # 问号
+    '!': '！',    # 感叹号
+    '(': '（',    # 左括号
+    ')': '）',    # 右括号
+    '[': '［',    # 左方括号
+    ']': '］',    # 右方括号
+    '{': '｛',    # 左花括号
+    '}': '｝',    # 右花括号
+    '<': '《',    # 左书名号
+    '>': '》',    # 右书名号
+    '«': '《',    # 法文左书名号
+    '»': '》',    # 法文右书名号
+})
+
+# 数字后的句号还原成点号（保持 1. 2. 3. 这类编号格式）
+_DIGIT_DOT_RE = re.compile(r'(\d+)。(\s)')
+
+# 归一化前置判断：文本里既无待转换的半角标点也无空白时可原样返回。
+# \s 必须包含在内——空白清理也是归一化管线的一部分
+_NEEDS_NORMALIZE_RE = re.compile(r'[,.;:?!()\[\]{}<>«»\s]')
+
+@lru_cache(maxsize=4096)
+def _normalize_punctuation(text: str) -> str:
+    """归一化标点并清理空白（纯函数；重复出现的条款短句只处理一次）"""
+    normalized = text.translate(_PUNCT_TRANS)
+    normalized = _DIGIT_DOT_RE.sub(r'\1. \2', normalized)
+    # 清理空白（与 _clean_spaces 同口径）
+    return ''.join(normalized.split())
+
+# 数字/数位查找表：每个字符一次字典查找拿到 (数值, 是否数位)，
+# 替代原来每字符最多三次的成员测试与分支
+_CN_TABLE = {
+    '一': (1, 0), '二': (2, 0), '三': (3, 0), '四': (4, 0), '五': (5, 0),
+    '六': (6, 0), '七': (7, 0), '八': (8, 0), '九': (9, 0),
+    '十': (10, 1), '百': (100, 1), '千': (1000, 1), '万': (10000, 1),
+}
+
+@lru_cache(maxsize=1024)
+def _parse_complex_chinese_number(chinese_num: str) -> int:
+    """解析复杂的中文数字（条文编号高度重复，缓存后同一字符串只算一次）"""
+    result = 0
+    temp_num = 0  # 临时存储当前数字
+
+    for char in chinese_num:
+        entry = _CN_TABLE.get(char)
+        if entry is None:
+            # "零"只是占位，未知字符同样跳过
+            continue
+        value, is_unit = entry
+        if is_unit:
+            # 数位单位：没有前导数字时默认为1（如开头的"十"表示10）
+            result += (temp_num or 1) * value
+            temp_num = 0
+        else:
+            temp_num = value
+
+    # 加上剩余的个位数
+    result += temp_num
+
+    return result if result > 0 else 0
 
 class LawParser:
     """法律文本解析器"""
     
     def __init__(self):
-        # 章节、节、条文的正则表达式模式
-        self.chapter_pattern = re.compile(r'^第[一二三四五六七八九十]+章[　\s]*(.+)', re.MULTILINE)
-        self.section_pattern = re.compile(r'^第[一二三四五六七八九十]+节[　\s]*(.+)', re.MULTILINE)
-        self.article_pattern = re.compile(r'^第([一二三四五六七八九十百零]+)条[　\s]*(.+)', re.MULTILINE)
+        # 热路径用到的正则统一预编译成属性，
+        # 免去每次调用时 re 模块的缓存查找开销
+        self._clause_marker_re = re.compile(r'^[\(（][一二三四五六七八九十百千万零\d]+[\)）]')
+        # 章/节标题判定合并成一个无回溯的字符类模式，一次匹配出结果
+        self._title_kind_re = re.compile(r'^第[一二三四五六七八九十]+[章节]')
+        self._chapter_num_re = re.compile(r'第([一二三四五六七八九十]+)章')
+        self._section_num_re = re.compile(r'第([一二三四五六七八九十]+)节')
+        self._article_strip_re = re.compile(r'^第[一二三四五六七八九十百零]+条[　\s]*')
+
+        # 行分发正则：章/节/条合并为一个带命名组的择一模式，
+        # 每行只扫一次，按命中的组分支，编号也一并捕获；
+        # 用可选的 regex 引擎编译（未安装时 _re_engine 即 re）
+        self._line_dispatch = _re_engine.compile(
+            r'^(?:第(?P<ch>[一二三四五六七八九十]+)章[　\s]*(?P<ch_t>.+)'
+            r'|第(?P<sc>[一二三四五六七八九十]+)节[　\s]*(?P<sc_t>.+)'
+            r'|第(?P<ar>[一二三四五六七八九十百零]+)条[　\s]*(?P<ar_t>.+))'
+        )
+
+        # 行尾标点分类集合：终止符都是单码点，
+        # 取末字符做一次哈希探测即可，比多后缀 endswith 逐个比较快
+        self._end_punct = frozenset('.。;；:：!！?？')
+        # 行首特殊标识字符：条款序号 (一)/（二） 必然以括号开头，
+        # 已被该集合覆盖，无需再跑条款标记正则
+        self._head_chars = frozenset('(（第条章节')
         
         # 中文数字转换字典
         self.chinese_to_num = self._build_chinese_number_dict()
-        
+
+
     def _build_chinese_number_dict(self) -> Dict[str, int]:
         """构建基础中文数字映射字典"""
-        return {
-            # 基础数字
-            '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
-            '六': 6, '七': 7, '八': 8, '九': 9,
-            # 数位
-            '十': 10, '百': 100, '千': 1000, '万': 10000
-        }
+        return dict(_CHINESE_BASE_NUMBERS)
     
     def convert_chinese_number(self, chinese_num: str) -> int:
         """将中文数字转换为阿拉伯数字"""
@@ -41,124 +153,50 @@ class LawParser:
         if chinese_num in base_numbers:
             return base_numbers[chinese_num]
         
-        # 复杂数字解析
-        return self._parse_complex_chinese_number(chinese_num, base_numbers)
-    
-    def _parse_complex_chinese_number(self, chinese_num: str, base_numbers: Dict[str, int]) -> int:
-        """解析复杂的中文数字"""
-        result = 0
-        temp_num = 0  # 临时存储当前数字
-        i = 0
-        
-        while i < len(chinese_num):
-            char = chinese_num[i]
-            
-            # 如果是基础数字（0-9）
-            if char in base_numbers and base_numbers[char] < 10:
-                temp_num = base_numbers[char]
-                i += 1
-                
-            # 如果是数位单位
-            elif char in ['十', '百', '千', '万']:
-                unit_value = base_numbers[char]
-                
-                # 特殊处理："十"在开头表示10
-                if char == '十' and i == 0:
-                    temp_num = 1
-                
-                # 如果没有前导数字，默认为1
-                if temp_num == 0:
-                    temp_num = 1
-                
-                # 计算当前数位的值
-                if unit_value == 10000:  # 万
-                    result += temp_num * unit_value
-                    temp_num = 0
-                elif unit_value >= 10:  # 十、百、千
-                    result += temp_num * unit_value
-                    temp_num = 0
-                
-                i += 1
-                
-            # 如果是"零"
-            elif char == '零':
-                # 零不参与计算，只是占位
-                i += 1
-                
-            else:
-                # 未知字符，跳过
-                i += 1
-        
-        # 加上剩余的个位数
-        result += temp_num
-        
-        return result if result > 0 else 0
+        # 复杂数字解析（模块级缓存函数）
+        return _parse_complex_chinese_number(chinese_num)
     
     def fix_pdf_line_breaks(self, text: str) -> str:
         """修复从PDF复制产生的错误换行"""
         if not text:
             return text
         
-        lines = text.split('\n')
+        # 单行内容没有换行可修，只需去掉首尾空白
+        if '\n' not in text:
+            return text.strip()
+        
         fixed_lines = []
-        i = 0
+        segment = []  # 当前逻辑行的片段，最后一次 join，避免逐行字符串拼接
         
-        while i < len(lines):
-            current_line = lines[i].strip()
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
             
-            # 如果当前行为空，跳过
-            if not current_line:
-                i += 1
+            # 空行结束当前逻辑行
+            if not line:
+                if segment:
+                    fixed_lines.append(''.join(segment))
+                    segment = []
                 continue
             
-            # 检查是否需要与下一行合并
-            while i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                
-                # 如果下一行为空，不合并
-                if not next_line:
-                    break
-                
-                # 检查是否应该合并的条件
-                should_merge = self._should_merge_lines(current_line, next_line)
-                
-                if should_merge:
-                    # 合并行
-                    current_line = current_line + next_line
-                    i += 1  # 跳过已合并的行
-                else:
-                    break
-            
-            fixed_lines.append(current_line)
-            i += 1
+            # 合并判断只取决于上一片段的行尾和当前行的行首
+            if segment and self._should_merge_lines(segment[-1], line):
+                segment.append(line)
+            else:
+                if segment:
+                    fixed_lines.append(''.join(segment))
+                segment = [line]
+        
+        if segment:
+            fixed_lines.append(''.join(segment))
         
         return '\n'.join(fixed_lines)
     
     def _should_merge_lines(self, current_line: str, next_line: str) -> bool:
         """判断两行是否应该合并"""
-        # 如果当前行以句号、分号、冒号等结束，通常不合并
-        if current_line.endswith(('.', '。', ';', '；', ':', '：', '!', '！', '?', '？')):
-            return False
-        
-        # 如果下一行以特殊标识开始，不合并
-        if next_line.startswith(('(', '（', '第', '条', '章', '节')):
-            return False
-        
-        # 如果下一行以数字加括号开始（如：(一)、（二）），不合并
-        if re.match(r'^[\(（][一二三四五六七八九十百千万零\d]+[\)）]', next_line):
-            return False
-        
-        # 如果当前行以逗号、顿号结束，通常需要合并
-        if current_line.endswith((',', '，', '、')):
-            return True
-        
-        # 如果当前行没有标点符号结尾，可能需要合并
-        # 同时检查全角和半角符号
-        if not re.search(r'[。，；：！？、.;:!?]$', current_line):
-            return True
-        
-        # 默认不合并
-        return False
+        # 合并与否只取决于两个字符：当前行末字符是否终止标点、
+        # 下一行首字符是否特殊标识，两次集合探测即可判定
+        return (current_line[-1:] not in self._end_punct
+                and next_line[:1] not in self._head_chars)
     
     def normalize_punctuation(self, text: str) -> str:
         """
@@ -167,59 +205,30 @@ class LawParser:
         """
         if not text:
             return text
-        
-        # 半角到全角的映射表
-        punctuation_map = {
-            ',': '，',    # 逗号
-            '.': '。',    # 句号  
-            ';': '；',    # 分号
-            ':': '：',    # 冒号
-            '?': '？',    # 问号
-            '!': '！',    # 感叹号
-            '(': '（',    # 左括号
-            ')': '）',    # 右括号
-            '[': '［',    # 左方括号
-            ']': '］',    # 右方括号
-            '{': '｛',    # 左花括号
-            '}': '｝',    # 右花括号
-            '<': '《',    # 左书名号
-            '>': '》',    # 右书名号
-            '«': '《',    # 法文左书名号
-            '»': '》',    # 法文右书名号
-            '"': '"',     # 英文双引号（统一用中文引号）
-            "'": "'",     # 英文单引号（统一用中文引号）
-        }
-        
-        # 执行替换
-        normalized_text = text
-        for half_width, full_width in punctuation_map.items():
-            normalized_text = normalized_text.replace(half_width, full_width)
-        
-        # 处理特殊情况：英文双引号统一替换
-        normalized_text = normalized_text.replace('"', '"')
-        
-        # 处理数字后的点号，如果是条文编号则保持为点号
-        # 例如：1. 2. 3. 这种情况保持不变
-        import re
-        # 将"数字。"格式改回"数字."（用于条文编号）
-        normalized_text = re.sub(r'(\d+)。(\s)', r'\1. \2', normalized_text)
-        
-        # 清理标点符号前后的多余空格
-        normalized_text = self._clean_spaces(normalized_text)
-        
-        return normalized_text
+        # 规范中文文本大多不含半角标点和空白，一次字符类扫描
+        # 判定后即可原样返回，省掉转换表和缓存查找
+        if _NEEDS_NORMALIZE_RE.search(text) is None:
+            return text
+        # 委托给模块级缓存函数：跨条文重复的文本直接命中缓存
+        return _normalize_punctuation(text)
     
     def _clean_spaces(self, text: str) -> str:
         """清理文本中的空格"""
         if not text:
             return text
-        return re.sub(r'\s+', '', text).strip()
+        # split/join 在C层按任意空白切分拼回，比正则替换更快
+        return ''.join(text.split())
     
     def clean_article_content(self, content: str) -> str:
         """清理条文内容，修复PDF复制问题并保持正确的段落结构"""
         if not content:
             return content
         
+        # 单行条文最常见：跳过换行修复与分段合并，直接做标点归一化
+        # （归一化内部已包含空白清理，结果与完整管线一致）
+        if '\n' not in content:
+            return self.normalize_punctuation(content)
+        
         # 首先修复PDF换行问题
         content = self.fix_pdf_line_breaks(content)
         
@@ -236,13 +245,13 @@ class LawParser:
                 continue
             
             # 检查是否是条款标识（如：(一)、（二）等）
-            if re.match(r'^[\(（][一二三四五六七八九十百千万零\d]+[\)）]', line):
+            if self._clause_marker_re.match(line):
                 processed_lines.append(line)
             else:
                 # 对于普通文本，如果不是以句号等结尾，可能需要与前面合并
-                if processed_lines and not processed_lines[-1].endswith(('.', '。', ';', '；', ':', '：', '!', '！', '?', '？')):
+                if processed_lines and processed_lines[-1][-1:] not in self._end_punct:
                     # 如果前一行不是条款标识，则合并
-                    if not re.match(r'^[\(（][一二三四五六七八九十百千万零\d]+[\)）]', processed_lines[-1]):
+                    if not self._clause_marker_re.match(processed_lines[-1]):
                         processed_lines[-1] = processed_lines[-1] + line
                     else:
                         processed_lines.append(line)
@@ -253,57 +262,47 @@ class LawParser:
     
     def clean_text(self, text: str) -> str:
         """清理文本，去除多余的空白字符"""
-        lines = text.split('\n')
+        return '\n'.join(self._clean_lines(text))
+
+    def _clean_lines(self, text: str) -> List[str]:
+        """拆行并去除空白行，各解析阶段复用同一列表，不再各自重新拆分"""
         cleaned_lines = []
-        for line in lines:
+        for line in text.split('\n'):
             cleaned_line = line.strip()
             if cleaned_line:
                 cleaned_lines.append(cleaned_line)
-        return '\n'.join(cleaned_lines)
+        return cleaned_lines
     
     def extract_pure_article_content(self, article_text: str) -> str:
         """提取纯净的条文内容，去除编号部分"""
-        article_number_pattern = re.compile(r'^第[一二三四五六七八九十百零]+条[　\s]*')
-        pure_content = article_number_pattern.sub('', article_text)
+        pure_content = self._article_strip_re.sub('', article_text)
         return pure_content.strip()
     
-    def parse_chapters(self, content: str) -> Dict[int, Dict[str, Any]]:
+    def parse_chapters(self, content_lines: List[str]) -> Dict[int, Dict[str, Any]]:
         """解析章节信息"""
-        chapters = {}
-        for match in self.chapter_pattern.finditer(content):
-            chapter_text = match.group(0).strip()
-            chapter_title = self._clean_spaces(match.group(1).strip())
-            chapter_num_match = re.search(r'第([一二三四五六七八九十]+)章', chapter_text)
-            if chapter_num_match:
-                chapter_num = self.convert_chinese_number(chapter_num_match.group(1))
-                chapters[chapter_num] = {
-                    'title': chapter_title,
-                    'full_text': chapter_text,
-                    'sections': {}
-                }
-        return chapters
+        return self.parse_structure(content_lines)[0]
     
-    def parse_sections(self, content: str) -> Dict[int, Dict[str, Any]]:
+    def parse_sections(self, content_lines: List[str]) -> Dict[int, Dict[str, Any]]:
         """解析节信息"""
-        sections = {}
-        for match in self.section_pattern.finditer(content):
-            section_text = match.group(0).strip()
-            section_title = match.group(1).strip()
-            section_num_match = re.search(r'第([一二三四五六七八九十]+)节', section_text)
-            if section_num_match:
-                section_num = self.convert_chinese_number(section_num_match.group(1))
-                sections[section_num] = {
-                    'title': section_title,
-                    'full_text': section_text
-                }
-        return sections
+        return self.parse_structure(content_lines)[1]
     
-    def parse_articles(self, content: str) -> Dict[int, Dict[str, Any]]:
+    def parse_articles(self, content_lines: List[str]) -> Dict[int, Dict[str, Any]]:
         """解析条文信息，并记录每个条文所属的章节"""
+        return self.parse_structure(content_lines)[2]
+    
+    def parse_structure(self, content_lines: List[str]) -> Tuple[Dict[int, Dict[str, Any]],
+                                                                 Dict[int, Dict[str, Any]],
+                                                                 Dict[int, Dict[str, Any]]]:
+        """
+        单次扫描同时解析章、节、条文，免去对同一批行的三遍遍历
+        content_lines 应为已去除首尾空白的行（_clean_lines 的产物）
+        """
+        chapters = {}
+        sections = {}
         articles = {}
-        content_lines = content.split('\n')
         current_article_num = None
         current_article_content = []
+        current_article_pure_first = None  # 首行去掉"第X条"前缀后的内容
         
         # 跟踪当前章节信息
         current_chapter_num = None
@@ -311,47 +310,50 @@ class LawParser:
         current_section_num = None
         current_section_title = None
         
+        # 每行都要用的方法绑定提升为局部变量，
+        # 省掉纯解释执行的循环里逐行的属性查找
+        line_dispatch_match = self._line_dispatch.match
+        convert_number = self.convert_chinese_number
+        is_title_line = self._is_section_or_chapter_title
+        
         for line in content_lines:
-            line_stripped = line.strip()
-            
-            # 检查是否是章标题
-            chapter_match = self.chapter_pattern.match(line)
-            if chapter_match:
-                chapter_title = chapter_match.group(1).strip()
-                chapter_num_match = re.search(r'第([一二三四五六七八九十]+)章', line)
-                if chapter_num_match:
-                    current_chapter_num = self.convert_chinese_number(chapter_num_match.group(1))
-                    current_chapter_title = chapter_title
-                    # 进入新章时重置节信息
-                    current_section_num = None
-                    current_section_title = None
+            # 行在 _clean_lines 已去过空白，不再重复 strip；
+            # 每行只做一次分发匹配，按命中的命名组判断行类型
+            dispatch_match = line_dispatch_match(line)
+
+            # 章标题
+            if dispatch_match and dispatch_match.group('ch'):
+                current_chapter_num = convert_number(dispatch_match.group('ch'))
+                current_chapter_title = dispatch_match.group('ch_t').strip()
+                # 标题去重驻留：同一部法多次解析/两版对比时章节标题高度重复
+                chapters[current_chapter_num] = {
+                    'title': sys.intern(self._clean_spaces(current_chapter_title)),
+                    'sections': {}
+                }
+                # 进入新章时重置节信息
+                current_section_num = None
+                current_section_title = None
                 continue
-            
-            # 检查是否是节标题
-            section_match = self.section_pattern.match(line)
-            if section_match:
-                section_title = section_match.group(1).strip()
-                section_num_match = re.search(r'第([一二三四五六七八九十]+)节', line)
-                if section_num_match:
-                    current_section_num = self.convert_chinese_number(section_num_match.group(1))
-                    current_section_title = section_title
+
+            # 节标题
+            if dispatch_match and dispatch_match.group('sc'):
+                current_section_num = convert_number(dispatch_match.group('sc'))
+                current_section_title = dispatch_match.group('sc_t').strip()
+                sections[current_section_num] = {
+                    'title': sys.intern(current_section_title)
+                }
                 continue
-            
-            # 检查是否是条文编号行
-            article_match = self.article_pattern.match(line)
-            if article_match:
+
+            # 条文编号行
+            if dispatch_match:
                 # 保存前一条
                 if current_article_num is not None:
-                    # 合并完整内容
-                    full_content = '\n'.join(current_article_content).strip()
-                    # 提取纯净内容（去除编号）
-                    pure_content = self.extract_pure_article_content(full_content)
-                    # 清理PDF换行问题
-                    pure_content = self.clean_article_content(pure_content)
+                    # 编号前缀在开条时已由分发正则剥离，免去整串正则替换
+                    pure_content = self.clean_article_content(
+                        '\n'.join([current_article_pure_first] + current_article_content[1:]))
                     
                     articles[current_article_num] = {
                         'content': pure_content,
-                        'full_text': full_content,
                         'chapter_num': current_chapter_num,
                         #'chapter_title': current_chapter_title,
                         'section_num': current_section_num,
@@ -360,28 +362,25 @@ class LawParser:
                     }
                 
                 # 开始新条
-                current_article_num = self.convert_chinese_number(article_match.group(1))
-                current_article_content = [line_stripped]
-            elif current_article_num is not None and line_stripped:
+                current_article_num = convert_number(dispatch_match.group('ar'))
+                current_article_content = [line]
+                current_article_pure_first = dispatch_match.group('ar_t')
+            elif current_article_num is not None and line:
                 # 检查是否是章节标题，如果是则跳过
-                if self._is_section_or_chapter_title(line_stripped):
+                if is_title_line(line):
                     continue
                 
                 # 继续当前条的内容
-                current_article_content.append(line_stripped)
+                current_article_content.append(line)
         
         # 保存最后一条
         if current_article_num is not None:
-            # 合并完整内容
-            full_content = '\n'.join(current_article_content).strip()
-            # 提取纯净内容（去除编号）
-            pure_content = self.extract_pure_article_content(full_content)
-            # 清理PDF换行问题
-            pure_content = self.clean_article_content(pure_content)
+            # 编号前缀在开条时已由分发正则剥离，免去整串正则替换
+            pure_content = self.clean_article_content(
+                '\n'.join([current_article_pure_first] + current_article_content[1:]))
             
             articles[current_article_num] = {
                 'content': pure_content,
-                'full_text': full_content,
                 'chapter_num': current_chapter_num,
                 'chapter_title': current_chapter_title,
                 'section_num': current_section_num,
@@ -389,39 +388,35 @@ class LawParser:
                 'line_count': len(current_article_content)
             }
         
-        return articles
+        return chapters, sections, articles
     
     def _is_section_or_chapter_title(self, line: str) -> bool:
-        """检查是否是章节标题"""
-        # 检查章标题模式：第X章 标题
-        if re.match(r'^第[一二三四五六七八九十]+章\s*', line):
-            return True
-        
-        # 检查节标题模式：第X节 标题 或 第X节标题
-        if re.match(r'^第[一二三四五六七八九十]+节', line):
-            return True
-        
-        return False
+        """检查是否是章节标题（第X章/第X节，标题可有可无）"""
+        return self._title_kind_re.match(line) is not None
     
     def parse_file(self, file_path: str) -> Dict[str, Any]:
         """解析法律文本文件，返回结构化数据"""
         print(f"正在解析文件: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # mmap 零拷贝读入，整个文件只解码一次
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    content = ''
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = mm[:].decode('utf-8')
         except FileNotFoundError:
             raise FileNotFoundError(f"文件未找到: {file_path}")
         except UnicodeDecodeError:
-            raise UnicodeDecodeError(f"文件编码错误，请确保文件为UTF-8编码: {file_path}")
+            raise ValueError(f"文件编码错误，请确保文件为UTF-8编码: {file_path}")
         
-        # 清理文本
-        content = self.clean_text(content)
+        # 清理文本：只拆一次行，各解析阶段共用同一列表
+        lines = self._clean_lines(content)
         
-        # 解析各部分
-        chapters = self.parse_chapters(content)
-        sections = self.parse_sections(content)
-        articles = self.parse_articles(content)
+        # 解析各部分（单次扫描同时产出章、节、条文）
+        chapters, sections, articles = self.parse_structure(lines)
         
         # 构建法律结构
         law_structure = {
@@ -433,7 +428,8 @@ class LawParser:
                 'total_chapters': len(chapters),
                 'total_sections': len(sections),
                 'total_articles': len(articles),
-                'total_content_length': len(content)
+                # 与原先拼接后整串计费一致：行长之和加换行符
+                'total_content_length': sum(map(len, lines)) + max(0, len(lines) - 1)
             }
         }
         
@@ -443,8 +439,14 @@ class LawParser:
     def save_parsed_data(self, law_structure: Dict[str, Any], output_file: str):
         """保存解析后的结构化数据到JSON文件"""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(law_structure, f, ensure_ascii=False, indent=2)
+            if HAS_ORJSON:
+                # OPT_NON_STR_KEYS：章节/条文字典以整数为键
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(law_structure,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(law_structure, f, ensure_ascii=False, indent=2)
             print(f"解析数据已保存到: {output_file}")
         except Exception as e:
             print(f"保存解析数据时出错: {e}")
@@ -487,7 +489,9 @@ def main():
         articles = law_data['articles']
         print(f"\n前{args.preview}条内容预览：")
         print("-" * 60)
-        for i, (article_num, article_info) in enumerate(sorted(articles.items())[:args.preview]):
+        # 只取前N条，nsmallest 避免为预览排序全部条文
+        for article_num, article_info in heapq.nsmallest(args.preview, articles.items(),
+                                                         key=lambda kv: kv[0]):
             print(f"第{article_num}条:")
             print(f"  内容: {article_info['content'][:150]}...")
             print()